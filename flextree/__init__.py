@@ -5,12 +5,20 @@ This package provides TreeNode and Tree classes for building hierarchical data s
 along with utilities for visualization, serialization, and manipulation.
 """
 
-from .flextree import TreeNode, Tree, draw_tree
-from .examples import examples
+from .flextree import TreeNode, Tree, ArenaTree, draw_tree
 from .jsonui import FlexTreeUI
 
 __version__ = "0.3.2"
 __author__ = "Zhenning Zhao"
 __email__ = "znzhaopersonal@gmail.com"
 
-__all__ = ["TreeNode", "Tree", "draw_tree", "examples", "FlexTreeUI"]
\ No newline at end of file
+__all__ = ["TreeNode", "Tree", "ArenaTree", "draw_tree", "examples", "FlexTreeUI"]
+
+
+def __getattr__(name):
+    # The examples module imports the package itself, so load it on first use
+    if name == "examples":
+        from .examples import examples
+        globals()["examples"] = examples
+        return examples
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -1,6 +1,39 @@
+import re
+import sys
 import json
 import copy
-from typing import Any, Optional, List, Dict, Union
+import mmap
+from array import array
+from json.encoder import encode_basestring as _encode_basestring
+from operator import attrgetter, itemgetter
+from typing import Any, Optional, Iterator, List, Dict, TextIO, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speed-up for save_json/load_json
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional speed-up for ArenaTree statistics
+    np = None
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+# Exact scalar types orjson encodes the same way as json.dumps
+_ORJSON_SCALAR_TYPES = frozenset((type(None), bool, int, str))
+
+# orjson reads integers outside the int64/uint64 range as floats; files
+# containing digit runs long enough for such values (19 digits already hold
+# those below -2**63) are parsed with the json module so they stay exact.
+_LONG_DIGITS = re.compile(rb"[0-9]{19}")
+
+# Number of children get_child() scans by name before indexing them
+_CHILD_INDEX_MIN = 16
+
+# Content types that copy.deepcopy() returns unchanged
+_ATOMIC_TYPES = frozenset((type(None), bool, int, float, complex, str, bytes))
 
 class TreeNode:
     """
@@ -10,11 +43,31 @@ class TreeNode:
     It can contain any type of content and maintains relationships with its
     parent and children nodes.
     
+    Children are stored with the left-child/right-sibling encoding: each
+    node links to its first and last child and to its previous and next
+    sibling, so no per-node list is allocated and a known child is
+    detached in constant time. The children property builds a list of
+    the direct children on access.
+    
     Attributes:
         name (str): The unique identifier/name for this node
         content (Any): The data/content stored in this node
-        children (List[TreeNode]): List of child nodes
+        children (List[TreeNode]): List of child nodes (read-only, built on access)
         parent (Optional[TreeNode]): Reference to parent node, None for root
+        first_child (Optional[TreeNode]): The first child, None for a leaf
+        last_child (Optional[TreeNode]): The last child, None for a leaf
+        next_sibling (Optional[TreeNode]): The next child of the same parent
+        prev_sibling (Optional[TreeNode]): The previous child of the same parent
+        
+    Renaming a node or changing its links increments the class-wide
+    _structure_version counter, which Tree uses to tell whether its name
+    index is still valid and draw_tree() uses to reuse a previous drawing.
+    Only link changes increment _shape_version, which guards the
+    statistics that count(), max_depth() and max_width() cache on a node.
+
+    Nodes with many children also keep a name -> first child dictionary,
+    built by get_child() once a search passes _CHILD_INDEX_MIN children
+    and dropped whenever a child is detached or renamed.
         
     Example:
         >>> root = TreeNode("root", "root content")
@@ -23,27 +76,193 @@ class TreeNode:
         >>> print(root.children[0].name)
         child1
     """
-    def __init__(self, name: str, content: Any = None):
+    __slots__ = ("_name", "content", "parent", "first_child", "last_child", "next_sibling",
+                 "prev_sibling", "_render_cache", "_child_index", "_stats_cache")
+
+    _structure_version = 0
+    _shape_version = 0
+
+    def __init__(self, name: str, content: Any = None, intern_content: bool = False):
         """
         Initialize a new TreeNode.
         
         Args:
-            name (str): The name/identifier for this node
+            name (str): The name/identifier for this node. String names
+                       are interned, so equal names share one object.
             content (Any, optional): The content to store in this node. 
                                    Can be any Python object. Defaults to None.
+            intern_content (bool, optional): If True and content is a string,
+                                   store the interned copy so that nodes with
+                                   equal string content share one object.
+                                   Defaults to False.
         """
-        self.name = name
-        self.content = content
-        self.children: List['TreeNode'] = []
+        self._name = _intern_str(name)
+        self.content = _intern_str(content) if intern_content else content
         self.parent: Optional['TreeNode'] = None
+        self.first_child: Optional['TreeNode'] = None
+        self.last_child: Optional['TreeNode'] = None
+        self.next_sibling: Optional['TreeNode'] = None
+        self.prev_sibling: Optional['TreeNode'] = None
+        self._render_cache: Optional[tuple] = None
+        self._child_index: Optional[Dict[str, 'TreeNode']] = None
+        self._stats_cache: Optional[tuple] = None
+
+    @property
+    def name(self) -> str:
+        """The name/identifier of this node."""
+        return self._name
+
+    @name.setter
+    def name(self, name: str):
+        self._name = _intern_str(name)
+        if self.parent is not None:
+            self.parent._child_index = None
+        TreeNode._structure_version += 1
+
+    @property
+    def children(self) -> List['TreeNode']:
+        """
+        List the direct children of this node.
+        
+        The list is built from the sibling links on every access, so
+        modifying it does not change the tree. Use add_child() and
+        remove_child() instead.
+        
+        Returns:
+            List[TreeNode]: The direct children, in insertion order
+        """
+        result = []
+        child = self.first_child
+        while child is not None:
+            result.append(child)
+            child = child.next_sibling
+        return result
+
+    def __getstate__(self):
+        """
+        Return the state used by pickle.
+        
+        The topmost node of a tree stores the whole tree as a flat list of
+        its descendants in pre-order together with the position of each
+        one's parent, so pickling needs no recursion however deep or wide
+        the tree is. Every other node only refers to that topmost node,
+        which links all nodes when it is restored.
+        """
+        top = self
+        while top.parent is not None and top._is_linked():
+            top = top.parent
+        if top is not self:
+            return (self._name, self.content, top)
+        nodes = list(_iter_preorder(self))
+        position = {id(node): i for i, node in enumerate(nodes)}
+        parents = [position[id(node.parent)] for node in nodes[1:]]
+        return (self._name, self.content, self.parent, nodes[1:], parents)
+
+    def __setstate__(self, state):
+        """
+        Restore a node from the state returned by __getstate__().
+        
+        Args:
+            state (tuple): (name, content, top) for a node inside a tree, or
+                          (name, content, parent, descendants, parents) for
+                          the topmost node
+        """
+        name, self.content = state[0], state[1]
+        self._name = _intern_str(name)
+        self._render_cache = None
+        self._child_index = None
+        self._stats_cache = None
+        if len(state) == 3:
+            if not hasattr(self, "next_sibling"):
+                # Otherwise already linked by the topmost node's state
+                self.parent = self.first_child = self.last_child = None
+                self.next_sibling = self.prev_sibling = None
+            return
+        self.parent, descendants, parents = state[2:]
+        self.next_sibling = self.prev_sibling = None
+        nodes = [self] + descendants
+        for node in nodes:
+            node.first_child = node.last_child = None
+        for node, index in zip(descendants, parents):
+            parent = nodes[index]
+            node.parent = parent
+            node.next_sibling = None
+            node.prev_sibling = parent.last_child
+            if parent.last_child is None:
+                parent.first_child = node
+            else:
+                parent.last_child.next_sibling = node
+            parent.last_child = node
+
+    def __copy__(self) -> 'TreeNode':
+        """
+        Return a shallow copy for copy.copy().
+        
+        The copy shares the parent, the children and the content of this
+        node without being linked into the tree itself.
+        
+        Returns:
+            TreeNode: The new node
+        """
+        clone = TreeNode(self._name, self.content)
+        clone.parent = self.parent
+        clone.first_child = self.first_child
+        clone.last_child = self.last_child
+        return clone
+
+    def _is_linked(self) -> bool:
+        """
+        Tell whether this node is among its parent's children.
+        
+        remove_child() keeps the parent reference of the removed node, so a
+        parent alone does not mean the node is still attached.
+        
+        Returns:
+            bool: True if the parent lists this node as a child
+        """
+        return self.prev_sibling is not None or (
+            self.parent is not None and self.parent.first_child is self)
+
+    def _unlink(self, child: 'TreeNode') -> bool:
+        """
+        Detach a direct child from the sibling links of this node.
+        
+        Args:
+            child (TreeNode): The child to detach
+            
+        Returns:
+            bool: True if the child was found and detached, False otherwise
+        """
+        if child.parent is not self:
+            return False
+        prev = child.prev_sibling
+        following = child.next_sibling
+        if prev is None:
+            if self.first_child is not child:
+                # Already removed: remove_child() keeps the parent reference
+                return False
+            self.first_child = following
+        else:
+            prev.next_sibling = following
+        if following is None:
+            self.last_child = prev
+        else:
+            following.prev_sibling = prev
+        child.next_sibling = None
+        child.prev_sibling = None
+        self._child_index = None
+        TreeNode._structure_version += 1
+        TreeNode._shape_version += 1
+        return True
 
     def add_child(self, child: 'TreeNode'):
         """
         Add a child node to this node.
         
         This method establishes a parent-child relationship by setting
-        the child's parent reference and adding the child to this node's
-        children list.
+        the child's parent reference and appending the child after the
+        current last child. A node that is still attached to another
+        parent is detached from it first.
         
         Args:
             child (TreeNode): The node to add as a child
@@ -55,8 +274,20 @@ class TreeNode:
             >>> child.parent == parent
             True
         """
+        if child.parent is not None:
+            child.parent._unlink(child)
         child.parent = self
-        self.children.append(child)
+        child.next_sibling = None
+        child.prev_sibling = self.last_child
+        if self.last_child is None:
+            self.first_child = child
+        else:
+            self.last_child.next_sibling = child
+        self.last_child = child
+        if self._child_index is not None:
+            self._child_index.setdefault(child._name, child)
+        TreeNode._structure_version += 1
+        TreeNode._shape_version += 1
 
     def remove_child(self, child: Union['TreeNode', str, int]):
         """
@@ -81,12 +312,25 @@ class TreeNode:
             >>> parent.remove_child(0)         # Remove by index
         """
         if isinstance(child, TreeNode):
-            self.children.remove(child)
+            if not self._unlink(child):
+                raise ValueError(f"{child!r} is not a child of {self!r}")
         elif isinstance(child, str):
-            self.children = [c for c in self.children if c.name != child]
+            # Every match is unlinked in place during one pass over the
+            # siblings; with a child index the pass starts at the first match
+            if self._child_index is None:
+                current = self.first_child
+            else:
+                current = self._child_index.get(child)
+            while current is not None:
+                following = current.next_sibling
+                if current._name == child:
+                    self._unlink(current)
+                current = following
         elif isinstance(child, int):
-            if 0 <= child < len(self.children):
-                del self.children[child]
+            if child >= 0:
+                current = self.get_child(child)
+                if current is not None:
+                    self._unlink(current)
 
     def get_child(self, key: Union[str, int]) -> Optional['TreeNode']:
         """
@@ -112,20 +356,56 @@ class TreeNode:
             True
         """
         if isinstance(key, str):
-            for child in self.children:
-                if child.name == key:
+            if self._child_index is not None:
+                return self._child_index.get(key)
+            child = self.first_child
+            scanned = 0
+            while child is not None:
+                if child._name == key:
                     return child
+                scanned += 1
+                if scanned == _CHILD_INDEX_MIN:
+                    # A long branch: index the children once instead of
+                    # scanning them on every lookup
+                    index = self._build_child_index()
+                    if index is not None:
+                        return index.get(key)
+                child = child.next_sibling
         elif isinstance(key, int):
-            if 0 <= key < len(self.children):
-                return self.children[key]
-            elif key < 0:
-                idx = len(self.children) + key
-                if 0 <= idx < len(self.children):
-                    return self.children[idx]
-                else:
-                    raise IndexError("Child index out of range")
+            if key >= 0:
+                child = self.first_child
+                while child is not None and key > 0:
+                    child = child.next_sibling
+                    key -= 1
+                return child
+            children = self.children
+            idx = len(children) + key
+            if 0 <= idx < len(children):
+                return children[idx]
+            else:
+                raise IndexError("Child index out of range")
         return None
 
+    def _build_child_index(self) -> Optional[Dict[str, 'TreeNode']]:
+        """
+        Build and store the name -> first child dictionary of this node.
+        
+        Returns:
+            Optional[Dict[str, TreeNode]]: The index, or None if some child
+                                          name is unhashable
+        """
+        index = {}
+        setdefault = index.setdefault
+        child = self.first_child
+        try:
+            while child is not None:
+                setdefault(child._name, child)
+                child = child.next_sibling
+        except TypeError:
+            return None
+        self._child_index = index
+        return index
+
     def set_content(self, content: Any):
         """
         Set or update the content of this node.
@@ -142,16 +422,22 @@ class TreeNode:
         """
         self.content = content
 
-    def get_subtree(self, name: str) -> Optional['TreeNode']:
+    def get_subtree(self, name: str, breadth_first: bool = False) -> Optional['TreeNode']:
         """
         Find and return a node by name anywhere in the subtree.
         
         This method performs a depth-first search starting from this node
         to find a node with the specified name. It searches through all
-        descendants, not just direct children.
+        descendants, not just direct children, and stops at the first match
+        in pre-order.
         
         Args:
             name (str): The name of the node to find
+            breadth_first (bool, optional): If True, search level by level
+                                          and return the shallowest match,
+                                          which avoids walking deep branches
+                                          when the name lives near this
+                                          node. Defaults to False.
             
         Returns:
             Optional[TreeNode]: The found node, or None if not found
@@ -166,20 +452,33 @@ class TreeNode:
             >>> found == grandchild
             True
         """
-        if self.name == name:
-            return self
-        for child in self.children:
-            result = child.get_subtree(name)
-            if result:
-                return result
+        if not breadth_first:
+            for node in _iter_preorder(self):
+                if node._name == name:
+                    return node
+            return None
+        level = [self]
+        while level:
+            below = []
+            append = below.append
+            for node in level:
+                if node._name == name:
+                    return node
+                child = node.first_child
+                while child is not None:
+                    append(child)
+                    child = child.next_sibling
+            level = below
         return None
 
     def to_dict(self) -> Dict:
         """
         Convert this node and its entire subtree to a dictionary.
         
-        This method recursively converts the node and all its descendants
-        into a nested dictionary structure suitable for JSON serialization.
+        This method converts the node and all its descendants into a nested
+        dictionary structure suitable for JSON serialization. The nesting
+        is built without recursion, so it is not limited by the depth of
+        the tree.
         
         Returns:
             Dict: A dictionary representation of the node with keys:
@@ -194,11 +493,20 @@ class TreeNode:
             >>> root.to_dict()
             {'name': 'root', 'content': 'content', 'children': [{'name': 'child', 'content': 'child_content', 'children': []}]}
         """
-        return {
-            'name': self.name,
-            'content': self.content,
-            'children': [child.to_dict() for child in self.children]
-        }
+        result = {'name': self._name, 'content': self.content, 'children': []}
+        # Each entry pairs a node with the list its children's dicts go in
+        stack = [(self, result['children'])]
+        while stack:
+            node, out = stack.pop()
+            append = out.append
+            child = node.first_child
+            while child is not None:
+                entry = {'name': child._name, 'content': child.content, 'children': []}
+                append(entry)
+                if child.first_child is not None:
+                    stack.append((child, entry['children']))
+                child = child.next_sibling
+        return result
 
     def count(self) -> int:
         """
@@ -214,15 +522,16 @@ class TreeNode:
             >>> root.count()
             2
         """
-        return 1 + sum(child.count() for child in self.children)
+        return self._stats()[0]
 
     @staticmethod
     def from_dict(data: Dict) -> 'TreeNode':
         """
         Create a TreeNode from a dictionary representation.
         
-        This static method recursively reconstructs a TreeNode and its entire
-        subtree from a dictionary structure, typically created by to_dict().
+        This static method reconstructs a TreeNode and its entire subtree
+        from a dictionary structure, typically created by to_dict(). It does
+        not recurse, so arbitrarily deep trees can be loaded.
         Parent-child relationships are automatically established.
         
         Args:
@@ -240,10 +549,29 @@ class TreeNode:
             >>> node.name
             'root'
         """
-        node = TreeNode(data['name'], data.get('content'))
-        for child_data in data.get('children', []):
-            node.add_child(TreeNode.from_dict(child_data))
-        return node
+        root = TreeNode(data['name'], data.get('content'))
+        # Build top-down with an explicit stack, linking each child list
+        # directly instead of going through add_child() per node
+        stack = []
+        if data.get('children'):
+            stack.append((root, data['children']))
+        while stack:
+            parent, children = stack.pop()
+            last = None
+            for child_data in children:
+                node = TreeNode(child_data['name'], child_data.get('content'))
+                node.parent = parent
+                node.prev_sibling = last
+                if last is None:
+                    parent.first_child = node
+                else:
+                    last.next_sibling = node
+                last = node
+                grandchildren = child_data.get('children')
+                if grandchildren:
+                    stack.append((node, grandchildren))
+            parent.last_child = last
+        return root
 
     def copy(self) -> 'TreeNode':
         """
@@ -295,14 +623,79 @@ class TreeNode:
             >>> len(deep_copy.children) == len(original.children)
             True
         """
-        # Create new node with deep copied content
-        new_node = TreeNode(self.name, copy.deepcopy(self.content))
-        
-        # Deep copy all children and add them
-        for child in self.children:
-            new_node.add_child(child.deepcopy())
-        
-        return new_node
+        return self._clone({})
+
+    def __deepcopy__(self, memo: Dict) -> 'TreeNode':
+        """
+        Support copy.deepcopy() without generic per-node dispatch.
+
+        Like the default deep copy, the whole tree this node belongs to is
+        copied, including its ancestors, and the copy of this node is
+        returned. A node removed from its parent is copied with its own
+        subtree, and the copy keeps a parent reference to a copy of the
+        tree it was removed from, as the default deep copy does.
+
+        Args:
+            memo (Dict): The copy.deepcopy() memo dictionary
+        """
+        top = self
+        while top.parent is not None and top._is_linked():
+            top = top.parent
+        clone = top._clone(memo)
+        if top.parent is not None:
+            clone.parent = copy.deepcopy(top.parent, memo)
+        return memo[id(self)]
+
+    def _clone(self, memo: Dict) -> 'TreeNode':
+        """
+        Deep copy the subtree rooted at this node without recursion.
+
+        The nodes are copied and linked breadth-first with the original
+        and copied nodes kept in two parallel lists. The contents are
+        copied afterwards by _deepcopy_content() with one memo for the
+        whole tree, so content shared between nodes stays shared within
+        the copy.
+
+        Args:
+            memo (Dict): copy.deepcopy() memo dictionary; every original
+                        node is registered in it
+
+        Returns:
+            TreeNode: The copy of this node, without a parent
+        """
+        nodes = [self]
+        clones = [TreeNode(self._name)]
+        append_node = nodes.append
+        append_clone = clones.append
+        i = 0
+        while i < len(nodes):
+            child = nodes[i].first_child
+            if child is not None:
+                parent_clone = clones[i]
+                previous = None
+                while child is not None:
+                    clone = TreeNode(child._name)
+                    clone.parent = parent_clone
+                    clone.prev_sibling = previous
+                    if previous is None:
+                        parent_clone.first_child = clone
+                    else:
+                        previous.next_sibling = clone
+                    previous = clone
+                    append_node(child)
+                    append_clone(clone)
+                    child = child.next_sibling
+                parent_clone.last_child = previous
+            i += 1
+        memo.update(zip(map(id, nodes), clones))
+
+        for clone, node in zip(clones, nodes):
+            content = node.content
+            if content.__class__ in _ATOMIC_TYPES:
+                clone.content = content
+            else:
+                clone.content = _deepcopy_content(content, memo)
+        return clones[0]
 
     def max_depth(self) -> int:
         """
@@ -324,9 +717,7 @@ class TreeNode:
             >>> root.max_depth()
             3
         """
-        if not self.children:
-            return 1
-        return 1 + max(child.max_depth() for child in self.children)
+        return self._stats()[1]
 
     def max_width(self) -> int:
         """
@@ -350,10 +741,7 @@ class TreeNode:
             >>> root.max_width()
             3
         """
-        if not self.children:
-            return 1
-        widths = [child.max_width() for child in self.children]
-        return max(len(self.children), max(widths))
+        return self._stats()[2]
 
     def summary(self):
         """
@@ -374,15 +762,67 @@ class TreeNode:
               - Max Depth: 2
               - Max Width: 1
         """
-        summary = f"{self.name}:"
+        return self._format_summary(self._stats())
+
+    def _format_summary(self, stats: tuple) -> str:
+        """
+        Format the summary of this node from precomputed statistics.
+        
+        Args:
+            stats (tuple): (count, max_depth, max_width) of this node's subtree
+            
+        Returns:
+            str: The text returned by summary()
+        """
         content_str = str(self.content)
         if len(content_str) > 40:
             content_str = content_str[:37] + "..."
-        summary += f" {content_str}"
-        summary += f"\n  - Max Depth: {self.max_depth()}"
-        summary += f"\n  - Max Width: {self.max_width()}"
-        summary += f"\n  - Node Count: {self.count()}"
-        return summary
+        count, depth, width = stats
+        return (f"{self.name}: {content_str}"
+                f"\n  - Max Depth: {depth}"
+                f"\n  - Max Width: {width}"
+                f"\n  - Node Count: {count}")
+
+    def _stats(self) -> tuple:
+        """
+        Return the node count, maximum depth and maximum width in one walk.
+        
+        The subtree is walked level by level: the depth is the number of
+        levels and the count the sum of their sizes, so no per-node depth
+        is tracked. The result is cached on this node until
+        TreeNode._shape_version changes, so renaming nodes or changing
+        their content keeps it.
+        
+        Returns:
+            tuple: (count, max_depth, max_width), as returned by count(),
+                   max_depth() and max_width()
+        """
+        cached = self._stats_cache
+        if cached is not None and cached[0] == TreeNode._shape_version:
+            return cached[1]
+        count = 0
+        deepest = 0
+        widest = 1
+        level = [self]
+        while level:
+            deepest += 1
+            count += len(level)
+            below = []
+            append = below.append
+            for node in level:
+                child = node.first_child
+                if child is None:
+                    continue
+                start = len(below)
+                while child is not None:
+                    append(child)
+                    child = child.next_sibling
+                if len(below) - start > widest:
+                    widest = len(below) - start
+            level = below
+        result = (count, deepest, widest)
+        self._stats_cache = (TreeNode._shape_version, result)
+        return result
     
     def __repr__(self):
         """
@@ -391,7 +831,12 @@ class TreeNode:
         Returns:
             str: A string showing the node's name and number of children
         """
-        return f"TreeNode(name={self.name}, children={len(self.children)})"
+        count = 0
+        child = self.first_child
+        while child is not None:
+            count += 1
+            child = child.next_sibling
+        return f"TreeNode(name={self.name}, children={count})"
 
     def __contains__(self, name: str) -> bool:
         """
@@ -420,7 +865,7 @@ class TreeNode:
             >>> "nonexistent" in root
             False
         """
-        return self.get_subtree(name) is not None
+        return self.get_subtree(name, breadth_first=True) is not None
 
     def is_leaf(self) -> bool:
         """
@@ -440,7 +885,7 @@ class TreeNode:
             >>> child.is_leaf()
             True
         """
-        return len(self.children) == 0
+        return self.first_child is None
 
     def draw(self, key: str = None):
         """
@@ -461,6 +906,15 @@ class Tree:
     and serialization. It maintains a reference to the root node and provides
     methods that operate on the entire tree structure.
     
+    Name lookups go through an index mapping each node name to the first
+    node with that name in depth-first pre-order. Names that occur more
+    than once also get an entry in an overflow map listing all of their
+    nodes in pre-order. The index is built on first
+    use and rebuilt whenever nodes were renamed, added or removed outside
+    of this Tree's own methods. Likewise count(), max_depth() and
+    max_width() are computed together in one walk and reused until the
+    structure changes.
+    
     Attributes:
         root (TreeNode): The root node of the tree
         
@@ -472,6 +926,9 @@ class Tree:
         >>> tree.max_depth()
         2
     """
+    __slots__ = ("root", "_index", "_index_overflow", "_index_root", "_index_version",
+                 "_subtrees", "_subtrees_version", "_nodes")
+
     def __init__(self, root: TreeNode):
         """
         Initialize a new Tree with the given root node.
@@ -480,6 +937,70 @@ class Tree:
             root (TreeNode): The root node of the tree
         """
         self.root = root
+        self._index: Dict[str, TreeNode] = {}
+        self._index_overflow: Dict[str, List[TreeNode]] = {}
+        self._index_root: Optional[TreeNode] = None
+        self._index_version = -1
+        self._subtrees: Dict[int, 'Tree'] = {}
+        self._subtrees_version = -1
+        self._nodes: Optional[tuple] = None
+
+    def _build_index(self):
+        """
+        Rebuild the name index with one depth-first pre-order walk.
+        """
+        index: Dict[str, TreeNode] = {}
+        overflow: Dict[str, List[TreeNode]] = {}
+        for node in _iter_preorder(self.root):
+            name = node._name
+            try:
+                first = index.get(name)
+            except TypeError:
+                # Unhashable names stay out of the index; _lookup() scans
+                # the tree for them instead
+                continue
+            if first is None:
+                index[name] = node
+            elif name in overflow:
+                overflow[name].append(node)
+            else:
+                overflow[name] = [first, node]
+        self._index = index
+        self._index_overflow = overflow
+        self._index_root = self.root
+        self._index_version = TreeNode._structure_version
+
+    def _current_index(self) -> Dict[str, TreeNode]:
+        """
+        Return the name index, rebuilding it first if it is stale.
+        
+        Returns:
+            Dict[str, TreeNode]: The first node of each name in pre-order
+        """
+        if (self._index_version != TreeNode._structure_version
+                or self._index_root is not self.root):
+            self._build_index()
+        return self._index
+
+    def _lookup(self, name: str) -> Optional[TreeNode]:
+        """
+        Find the first node with the given name in depth-first pre-order.
+        
+        Args:
+            name (str): The name of the node to find
+            
+        Returns:
+            Optional[TreeNode]: The found node, or None if not found
+        """
+        index = self._current_index()
+        try:
+            return index.get(name)
+        except TypeError:
+            # Unhashable names are not indexed, so search for this one
+            for node in _iter_preorder(self.root):
+                if node._name == name:
+                    return node
+            return None
 
     def insert(self, parent_name: str, node: TreeNode):
         """
@@ -501,9 +1022,49 @@ class Tree:
             >>> len(root.children)
             1
         """
-        parent = self.root.get_subtree(parent_name)
+        parent = self._lookup(parent_name)
         if parent:
+            if node.parent is not None:
+                # The node may be moving within this tree
+                self._unindex_subtree(node)
             parent.add_child(node)
+            self._index_subtree(node)
+
+    def _index_subtree(self, node: TreeNode):
+        """
+        Add a newly attached subtree to an index that was valid before.
+        
+        A node whose name is already indexed is placed among the nodes of
+        that name by a binary search on their pre-order positions, so the
+        index stays valid without a full rebuild.
+        
+        Args:
+            node (TreeNode): The root of the attached subtree
+        """
+        index = self._index
+        overflow = self._index_overflow
+        for current in _iter_preorder(node):
+            name = current._name
+            try:
+                first = index.get(name)
+            except TypeError:
+                continue
+            if first is None:
+                index[name] = current
+                continue
+            nodes = overflow.get(name)
+            if nodes is None:
+                nodes = overflow[name] = [first]
+            lo, hi = 0, len(nodes)
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if _precedes(nodes[mid], current):
+                    lo = mid + 1
+                else:
+                    hi = mid
+            nodes.insert(lo, current)
+            index[name] = nodes[0]
+        self._index_version = TreeNode._structure_version
 
     def delete(self, node_name: str):
         """
@@ -525,9 +1086,39 @@ class Tree:
             >>> len(root.children)
             0
         """
-        node = self.root.get_subtree(node_name)
+        node = self._lookup(node_name)
         if node and node.parent:
             node.parent.remove_child(node)
+            if node is not self.root:
+                self._unindex_subtree(node)
+            self._index_version = TreeNode._structure_version
+
+    def _unindex_subtree(self, node: TreeNode):
+        """
+        Remove a detached subtree from the name index.
+        
+        Args:
+            node (TreeNode): The root of the detached subtree
+        """
+        index = self._index
+        overflow = self._index_overflow
+        for current in _iter_preorder(node):
+            name = current._name
+            try:
+                nodes = overflow.get(name)
+            except TypeError:
+                continue
+            if nodes is None:
+                if index.get(name) is current:
+                    del index[name]
+                continue
+            for i, indexed in enumerate(nodes):
+                if indexed is current:
+                    del nodes[i]
+                    break
+            index[name] = nodes[0]
+            if len(nodes) == 1:
+                del overflow[name]
 
     def alter(self, node_name: str, new_content: Any):
         """
@@ -548,7 +1139,7 @@ class Tree:
             >>> root.content
             'new content'
         """
-        node = self.root.get_subtree(node_name)
+        node = self._lookup(node_name)
         if node:
             node.set_content(new_content)
 
@@ -579,13 +1170,36 @@ class Tree:
         """
         node = None
         if isinstance(key, str):
-            node = self.root.get_subtree(key)
+            node = self._lookup(key)
         elif isinstance(key, int):
             node = self.root.get_child(key)
         if node:
-            return Tree(node)
+            return self._subtree(node)
         return None
-    
+
+    def _subtree(self, node: TreeNode) -> 'Tree':
+        """
+        Return a Tree rooted at node, reusing the one from earlier lookups.
+        
+        Subtree wrappers are kept until the structure of any tree changes,
+        so indexing an unchanged tree repeatedly returns the same objects,
+        along with their already built name indexes. A wrapper whose root
+        was reassigned is replaced.
+        
+        Args:
+            node (TreeNode): The root of the subtree
+            
+        Returns:
+            Tree: A Tree whose root is node
+        """
+        if self._subtrees_version != TreeNode._structure_version:
+            self._subtrees = {}
+            self._subtrees_version = TreeNode._structure_version
+        subtree = self._subtrees.get(id(node))
+        if subtree is None or subtree.root is not node:
+            subtree = self._subtrees[id(node)] = Tree(node)
+        return subtree
+
     def __getitem__(self, key: Union[str, int, slice, list]) -> Optional[Union['Tree', List['Tree']]]:
         """
         Allow access to subtrees using indexing, slicing, or a list of keys.
@@ -601,6 +1215,10 @@ class Tree:
             >>> tree[1:3]          # returns list of Tree objects for children 1 and 2
             >>> tree[["child1", "child2"]] # returns list of Tree objects for child1 and child2
         """
+        handler = self._GETITEM.get(type(key))
+        if handler is not None:
+            return handler(self, key)
+        # Subclasses of the dispatched types, such as bool
         if isinstance(key, int):
             return self.get(key)
         elif isinstance(key, slice):
@@ -618,6 +1236,34 @@ class Tree:
         else:
             return self.get(key)
 
+    def _getitem_name(self, key: str) -> Optional['Tree']:
+        """Handle tree[name]: the first node with that name, as a subtree."""
+        node = self._lookup(key)
+        return self._subtree(node) if node is not None else None
+
+    def _getitem_index(self, key: int) -> Optional['Tree']:
+        """Handle tree[i]: the i-th direct child of the root, as a subtree."""
+        node = self.root.get_child(key)
+        return self._subtree(node) if node is not None else None
+
+    def _getitem_slice(self, key: slice) -> List['Tree']:
+        """Handle tree[i:j]: a slice of the root's direct children, as subtrees."""
+        subtree = self._subtree
+        return [subtree(node) for node in self.root.children[key]]
+
+    def _getitem_names(self, key: list) -> List['Tree']:
+        """Handle tree[[names]]: the subtrees of every name that is found."""
+        if not all(isinstance(k, str) for k in key):
+            raise TypeError("List keys must be strings")
+        # One freshness check for the whole list, then plain dict lookups
+        nodes = list(map(self._current_index().get, key))
+        subtree = self._subtree
+        return [subtree(node) for node in nodes if node is not None]
+
+    # Exact key type -> handler, checked before the isinstance() fallbacks
+    _GETITEM = {str: _getitem_name, int: _getitem_index,
+                slice: _getitem_slice, list: _getitem_names}
+
     def count(self) -> int:
         """
         Count the total number of nodes in the entire tree.
@@ -625,7 +1271,18 @@ class Tree:
         Returns:
             int: The total number of nodes including root and all descendants
         """
-        return self.root.count()
+        return self._structure_stats()[0]
+
+    def _structure_stats(self) -> tuple:
+        """
+        Return the node count, maximum depth and maximum width of the tree.
+        
+        The values are cached on the root node; see TreeNode._stats().
+        
+        Returns:
+            tuple: (count, max_depth, max_width)
+        """
+        return self.root._stats()
 
     def summary(self):
         """
@@ -644,7 +1301,7 @@ class Tree:
             >>> "root:" in summary
             True
         """
-        return self.root.summary()
+        return self.root._format_summary(self._structure_stats())
 
     def __repr__(self):
         """
@@ -653,7 +1310,8 @@ class Tree:
         Returns:
             str: A string showing the root node, tree depth, and width
         """
-        return f"Tree(root={self.root}, depth={self.max_depth()}, width={self.max_width()})"
+        _, depth, width = self._structure_stats()
+        return f"Tree(root={self.root}, depth={depth}, width={width})"
 
     def __contains__(self, name: str) -> bool:
         """
@@ -681,7 +1339,71 @@ class Tree:
             >>> "nonexistent" in tree
             False
         """
-        return name in self.root
+        index = self._current_index()
+        try:
+            return name in index
+        except TypeError:
+            return self._lookup(name) is not None
+
+    def __iter__(self) -> Iterator[TreeNode]:
+        """
+        Iterate over all nodes of the tree in depth-first pre-order.
+        
+        Returns:
+            Iterator[TreeNode]: An iterator over the nodes, starting at the root
+            
+        Example:
+            >>> root = TreeNode("root")
+            >>> root.add_child(TreeNode("child"))
+            >>> [node.name for node in Tree(root)]
+            ['root', 'child']
+        """
+        return self.walk()
+
+    def walk(self, breadth_first: bool = False) -> Iterator[TreeNode]:
+        """
+        Iterate over all nodes of the tree.
+        
+        The nodes are listed once and the list is kept until the structure
+        changes, so repeated iterations over an unchanged tree are plain
+        list scans. Changing the tree while iterating does not affect the
+        iteration in progress.
+        
+        Args:
+            breadth_first (bool, optional): If True, visit the nodes level by
+                                          level instead of in depth-first
+                                          pre-order. Defaults to False.
+            
+        Returns:
+            Iterator[TreeNode]: An iterator over the nodes, starting at the root
+            
+        Example:
+            >>> root = TreeNode("root")
+            >>> child = TreeNode("child")
+            >>> root.add_child(child)
+            >>> child.add_child(TreeNode("grandchild"))
+            >>> root.add_child(TreeNode("sibling"))
+            >>> tree = Tree(root)
+            >>> [node.name for node in tree.walk()]
+            ['root', 'child', 'grandchild', 'sibling']
+            >>> [node.name for node in tree.walk(breadth_first=True)]
+            ['root', 'child', 'sibling', 'grandchild']
+        """
+        key = (TreeNode._structure_version, self.root, breadth_first)
+        cached = self._nodes
+        if cached is None or cached[0] != key:
+            if breadth_first:
+                nodes = [self.root]
+                append = nodes.append
+                for node in nodes:
+                    child = node.first_child
+                    while child is not None:
+                        append(child)
+                        child = child.next_sibling
+            else:
+                nodes = list(_iter_preorder(self.root))
+            cached = self._nodes = (key, nodes)
+        return iter(cached[1])
 
     def is_leaf(self, name: str) -> bool:
         """
@@ -712,7 +1434,7 @@ class Tree:
             >>> tree.is_leaf("nonexistent")
             False
         """
-        node = self.root.get_subtree(name)
+        node = self._lookup(name)
         if node is None:
             return False
         return node.is_leaf()
@@ -723,20 +1445,29 @@ class Tree:
         
         This method serializes the entire tree structure to a JSON file
         using UTF-8 encoding with pretty formatting (2-space indentation).
+        The JSON text is written node by node while walking the tree, so
+        no intermediate dictionary copy of the tree is built. If orjson is
+        installed it encodes names and contents made only of dicts, lists,
+        strings, integers, booleans and None. Everything else, such as
+        floats, which orjson formats differently, integers beyond 64 bits
+        and types like datetime that orjson encodes but the json module
+        rejects, goes to the standard json module, so the same contents are
+        accepted and the file reads the same either way.
         
         Args:
             filepath (str): The path where to save the JSON file
             
         Raises:
             IOError: If the file cannot be written
+            TypeError: If a name or content is not JSON serializable
             
         Example:
             >>> root = TreeNode("root", "content")
             >>> tree = Tree(root)
             >>> tree.save_json("my_tree.json")
         """
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(self.root.to_dict(), f, ensure_ascii=False, indent=2)
+        with open(filepath, 'wb', buffering=1 << 20) as f:
+            _write_json(self.root, f.write)
 
     @staticmethod
     def load_json(filepath: str) -> 'Tree':
@@ -745,7 +1476,8 @@ class Tree:
         
         This static method deserializes a tree structure from a JSON file
         and returns a new Tree object. The JSON structure should match
-        the format produced by save_json().
+        the format produced by save_json(). If orjson is installed it is
+        used for parsing.
         
         Args:
             filepath (str): The path to the JSON file to load
@@ -763,9 +1495,7 @@ class Tree:
             >>> tree.root.name
             'root'
         """
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        root = TreeNode.from_dict(data)
+        root = TreeNode.from_dict(_read_json(filepath))
         return Tree(root)
     
     def max_depth(self) -> int:
@@ -783,7 +1513,7 @@ class Tree:
             >>> tree.max_depth()
             2
         """
-        return self.root.max_depth()
+        return self._structure_stats()[1]
 
     def max_width(self) -> int:
         """
@@ -802,7 +1532,7 @@ class Tree:
             >>> tree.max_width()
             2
         """
-        return self.root.max_width()
+        return self._structure_stats()[2]
     
     def draw(self, key: str = None):
         """
@@ -848,6 +1578,29 @@ class Tree:
             Dict: A dictionary representation of the tree
         """
         return self.root.to_dict()
+
+    def compile(self) -> 'ArenaTree':
+        """
+        Flatten the tree into a compact, array-based ArenaTree.
+        
+        The nodes are numbered breadth-first and stored in parallel arrays
+        of names, contents, parent indices and child ranges, so bulk
+        queries on the result (count, max_depth, max_width, children, find)
+        run over contiguous arrays instead of chasing node references. The
+        result is a snapshot: later changes to this tree are not reflected
+        in it. Contents are shared with the nodes, not copied.
+        
+        Returns:
+            ArenaTree: A compact ArenaTree with the structure of this tree
+            
+        Example:
+            >>> root = TreeNode("root")
+            >>> root.add_child(TreeNode("child"))
+            >>> compiled = Tree(root).compile()
+            >>> compiled.count(), compiled.max_depth()
+            (2, 2)
+        """
+        return ArenaTree.from_node(self.root)
     
     def copy(self) -> 'Tree':
         """
@@ -901,25 +1654,932 @@ class Tree:
         """
         return Tree(self.root.deepcopy())
 
-def draw_tree(node: TreeNode, prefix: str = "", is_last: bool = True, key: str = None):
+    def intern_contents(self):
+        """
+        Intern the string content of every node in the tree.
+
+        Afterwards nodes with equal string content share a single string
+        object, which saves memory when many nodes carry the same text.
+        Non-string content is left untouched.
+
+        Example:
+            >>> root = TreeNode("root", "".join(["ad", "min"]))
+            >>> root.add_child(TreeNode("child", "".join(["adm", "in"])))
+            >>> tree = Tree(root)
+            >>> tree.intern_contents()
+            >>> tree.root.content is tree.root.children[0].content
+            True
+        """
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            node.content = _intern_str(node.content)
+            child = node.first_child
+            while child is not None:
+                stack.append(child)
+                child = child.next_sibling
+
+
+class _Arena:
+    """
+    Structure-of-arrays storage for the nodes of an ArenaTree.
+
+    Every node is an integer index into a set of parallel arrays. Links
+    between nodes are stored as indices as well, with -1 meaning "none".
+    A node is always appended after its parent, so parent[i] < i holds
+    for every non-root node.
+
+    The arena is in one of two layouts. In the linked layout children are
+    chained through first_child/last_child/next_sibling. In the compact
+    layout, built breadth-first, the children of a node occupy the index
+    range child_start[i] to child_start[i] + child_count[i] and the link
+    arrays are dropped. Appending a node to a compact arena converts it
+    back to the linked layout.
+
+    Attributes:
+        names (List[str]): The name of each node
+        contents (List[Any]): The content of each node
+        parent (array): Index of each node's parent, -1 for the root
+        first_child (Optional[array]): Index of each node's first child, -1 if none
+        last_child (Optional[array]): Index of each node's last child, -1 if none
+        next_sibling (Optional[array]): Index of each node's next sibling, -1 if none
+        child_start (Optional[array]): Index of each node's first child
+        child_count (Optional[array]): Number of children of each node
+    """
+    __slots__ = ("names", "contents", "parent", "first_child", "last_child", "next_sibling",
+                 "child_start", "child_count")
+
+    def __init__(self):
+        """Initialize an empty arena."""
+        self.names: List[str] = []
+        self.contents: List[Any] = []
+        self.parent = array('i')
+        self.first_child = array('i')
+        self.last_child = array('i')
+        self.next_sibling = array('i')
+        self.child_start: Optional[array] = None
+        self.child_count: Optional[array] = None
+
+    def __len__(self) -> int:
+        """Return the number of nodes stored in the arena."""
+        return len(self.names)
+
+    def append_node(self, name: str, content: Any = None, parent: int = -1) -> int:
+        """
+        Append a node to the arena and link it as the last child of parent.
+
+        Args:
+            name (str): The name of the new node
+            content (Any, optional): The content of the new node. Defaults to None.
+            parent (int, optional): Index of the parent node, or -1 for a root.
+                                  Defaults to -1.
+
+        Returns:
+            int: The index of the new node
+        """
+        if self.child_start is not None:
+            self._link()
+        idx = len(self.names)
+        self.names.append(name)
+        self.contents.append(content)
+        self.parent.append(parent)
+        self.first_child.append(-1)
+        self.last_child.append(-1)
+        self.next_sibling.append(-1)
+        if parent >= 0:
+            last = self.last_child[parent]
+            if last < 0:
+                self.first_child[parent] = idx
+            else:
+                self.next_sibling[last] = idx
+            self.last_child[parent] = idx
+        return idx
+
+    def _ensure_capacity(self, size: int):
+        """
+        Pre-extend the node arrays to hold at least size nodes.
+
+        The new entries are placeholders (None names and contents, parent
+        -1) that the caller must overwrite by index. Only the name, content
+        and parent arrays are extended; the child layout is left to the
+        caller.
+
+        Args:
+            size (int): The number of nodes the arrays must hold
+        """
+        missing = size - len(self.names)
+        if missing > 0:
+            self.names.extend([None] * missing)
+            self.contents.extend([None] * missing)
+            self.parent.extend(array('i', [-1]) * missing)
+
+    def _link(self):
+        """
+        Convert a compact arena to the linked layout.
+        """
+        size = len(self.names)
+        child_start = self.child_start
+        child_count = self.child_count
+        first_child = array('i', [-1]) * size
+        last_child = array('i', [-1]) * size
+        next_sibling = array('i', [-1]) * size
+        for idx in range(size):
+            count = child_count[idx]
+            if count:
+                start = child_start[idx]
+                end = start + count - 1
+                first_child[idx] = start
+                last_child[idx] = end
+                for child in range(start, end):
+                    next_sibling[child] = child + 1
+        self.first_child = first_child
+        self.last_child = last_child
+        self.next_sibling = next_sibling
+        self.child_start = None
+        self.child_count = None
+
+
+class ArenaTree:
+    """
+    A compact tree stored as a structure-of-arrays arena.
+
+    ArenaTree keeps node names, contents and links in parallel arrays
+    indexed by integers instead of one Python object per node. This keeps
+    traversals sequential in memory and makes count(), max_depth() and
+    max_width() simple loops over arrays. It is meant for large trees that
+    are built once and queried often; use TreeNode and Tree for trees
+    that are edited heavily.
+
+    The root node always has index 0. compact() renumbers the nodes in
+    breadth-first order so that the children of every node occupy
+    consecutive indices; from_node() produces this layout directly.
+
+    Example:
+        >>> arena = ArenaTree("root", "root content")
+        >>> child = arena.add_child(0, "child", "child content")
+        >>> arena.add_child(child, "grandchild")
+        2
+        >>> arena.max_depth()
+        3
+    """
+    __slots__ = ("_arena",)
+
+    def __init__(self, name: str, content: Any = None):
+        """
+        Initialize a new ArenaTree with a single root node.
+
+        Args:
+            name (str): The name of the root node
+            content (Any, optional): The content of the root node. Defaults to None.
+        """
+        self._arena = _Arena()
+        self._arena.append_node(name, content)
+
+    def __len__(self) -> int:
+        """Return the number of nodes in the tree."""
+        return len(self._arena)
+
+    def add_child(self, parent: int, name: str, content: Any = None) -> int:
+        """
+        Add a new node as the last child of the given parent node.
+
+        Args:
+            parent (int): Index of the parent node
+            name (str): The name of the new node
+            content (Any, optional): The content of the new node. Defaults to None.
+
+        Returns:
+            int: The index of the new node
+
+        Raises:
+            IndexError: If parent is not a valid node index
+        """
+        if not 0 <= parent < len(self._arena):
+            raise IndexError("Parent index out of range")
+        return self._arena.append_node(name, content, parent)
+
+    def compact(self):
+        """
+        Renumber the nodes in breadth-first order.
+
+        After compaction the children of each node have consecutive
+        indices, and the arena stores only the first child index and
+        child count of every node instead of sibling links. Adding a node
+        restores the linked layout until compact() is called again.
+        Calling it on a compact tree does nothing.
+
+        Indices obtained before compaction no longer refer to the same
+        nodes afterwards; use find() to look nodes up again.
+        """
+        arena = self._arena
+        if arena.child_start is not None:
+            return
+        self._arena = _bfs_arena(0, self.children, arena.names.__getitem__,
+                                 arena.contents.__getitem__, len(arena))
+
+    def name(self, idx: int) -> str:
+        """Return the name of the node at index idx."""
+        return self._arena.names[idx]
+
+    def content(self, idx: int) -> Any:
+        """Return the content of the node at index idx."""
+        return self._arena.contents[idx]
+
+    def children(self, idx: int = 0) -> List[int]:
+        """
+        Return the indices of the direct children of a node.
+
+        Args:
+            idx (int, optional): Index of the node. Defaults to 0 (the root).
+
+        Returns:
+            List[int]: The child indices, in insertion order
+        """
+        arena = self._arena
+        if arena.child_start is not None:
+            start = arena.child_start[idx]
+            return list(range(start, start + arena.child_count[idx]))
+        next_sibling = arena.next_sibling
+        result = []
+        child = arena.first_child[idx]
+        while child >= 0:
+            result.append(child)
+            child = next_sibling[child]
+        return result
+
+    def find(self, name: str) -> Optional[int]:
+        """
+        Find the first node with the given name in depth-first pre-order.
+
+        Args:
+            name (str): The name of the node to find
+
+        Returns:
+            Optional[int]: The index of the found node, or None if not found
+        """
+        names = self._arena.names
+        # Scan the flat name list in C first; only a duplicated name needs
+        # the tree walk to tell which match comes first in pre-order
+        matches = names.count(name)
+        if matches == 0:
+            return None
+        if matches == 1:
+            return names.index(name)
+        children = self.children
+        stack = [0]
+        while stack:
+            idx = stack.pop()
+            if names[idx] == name:
+                return idx
+            stack.extend(reversed(children(idx)))
+        return None
+
+    def count(self) -> int:
+        """
+        Count the total number of nodes in the tree.
+
+        Returns:
+            int: The total number of nodes including the root
+        """
+        return len(self._arena)
+
+    def max_depth(self) -> int:
+        """
+        Calculate the maximum depth of the tree.
+
+        In the compact layout nodes are stored in breadth-first order, so
+        the last node is among the deepest and only its ancestors need to
+        be counted. Otherwise, since every node is stored after its parent,
+        the depth of all nodes is computed in a single forward pass over
+        the parent array. For large arenas that pass is compiled with Numba
+        when it is installed, or replaced by whole-array NumPy operations
+        when only NumPy is.
+
+        Returns:
+            int: The maximum number of nodes on a path from the root to a leaf
+        """
+        parent = self._arena.parent
+        if self._arena.child_start is not None:
+            depth = 1
+            idx = parent[-1]
+            while idx >= 0:
+                depth += 1
+                idx = parent[idx]
+            return depth
+        if len(parent) >= _JIT_MIN_NODES:
+            kernel = _jit_kernel("max_depth")
+            if kernel is not None:
+                return int(kernel(np.frombuffer(parent, dtype=np.intc)))
+            if np is not None:
+                return _max_depth_numpy(np.frombuffer(parent, dtype=np.intc))
+        depth = [1] * len(parent)
+        for i in range(1, len(parent)):
+            depth[i] = depth[parent[i]] + 1
+        return max(depth)
+
+    def max_width(self) -> int:
+        """
+        Calculate the maximum width of the tree.
+
+        The width follows TreeNode.max_width(): the largest number of direct
+        children of any node, and 1 for a tree with a single node.
+
+        When NumPy is installed the child counts are reduced as a vector,
+        reading the index arrays in place without copying them.
+
+        Returns:
+            int: The maximum number of children of any node
+        """
+        child_count = self._arena.child_count
+        parent = self._arena.parent
+        if np is not None:
+            if child_count is not None:
+                return max(1, int(np.frombuffer(child_count, dtype=np.intc).max()))
+            if len(parent) == 1:
+                return 1
+            return max(1, int(np.bincount(np.frombuffer(parent, dtype=np.intc)[1:]).max()))
+        if child_count is not None:
+            return max(1, max(child_count))
+        child_count = [0] * len(parent)
+        for i in range(1, len(parent)):
+            child_count[parent[i]] += 1
+        return max(1, max(child_count))
+
+    @staticmethod
+    def from_node(node: TreeNode) -> 'ArenaTree':
+        """
+        Build an ArenaTree from a TreeNode and its entire subtree.
+
+        Contents are shared with the source nodes, not copied. The nodes
+        are numbered in breadth-first order, so the result is already
+        compact.
+
+        Args:
+            node (TreeNode): The root of the subtree to convert
+
+        Returns:
+            ArenaTree: A new ArenaTree with the same structure
+
+        Example:
+            >>> root = TreeNode("root")
+            >>> root.add_child(TreeNode("child"))
+            >>> ArenaTree.from_node(root).count()
+            2
+        """
+        tree = ArenaTree.__new__(ArenaTree)
+        tree._arena = _bfs_arena(node, _node_children, _node_name, _node_content, node.count())
+        return tree
+
+    @staticmethod
+    def from_dict(data: Dict) -> 'ArenaTree':
+        """
+        Build an ArenaTree from a dictionary representation.
+
+        The dictionary uses the format produced by TreeNode.to_dict(). The
+        nodes are counted first so the arena is allocated once at its final
+        size, then filled in breadth-first order; the result is compact.
+
+        Args:
+            data (Dict): Dictionary with 'name', 'content' and 'children' keys
+
+        Returns:
+            ArenaTree: A new ArenaTree with the same structure
+
+        Example:
+            >>> data = {'name': 'root', 'content': 'test',
+            ...         'children': [{'name': 'child', 'children': []}]}
+            >>> ArenaTree.from_dict(data).children()
+            [1]
+        """
+        tree = ArenaTree.__new__(ArenaTree)
+        tree._arena = _bfs_arena(data, _dict_children, _dict_name, _dict_content, _count_dicts(data))
+        return tree
+
+    @staticmethod
+    def load_json(filepath: str) -> 'ArenaTree':
+        """
+        Load an ArenaTree from a JSON file written by Tree.save_json().
+
+        Args:
+            filepath (str): The path to the JSON file to load
+
+        Returns:
+            ArenaTree: A new, compact ArenaTree loaded from the file
+
+        Raises:
+            IOError: If the file cannot be read
+            json.JSONDecodeError: If the file contains invalid JSON
+            KeyError: If the JSON structure is invalid
+        """
+        return ArenaTree.from_dict(_read_json(filepath))
+
+    def to_node(self, idx: int = 0) -> TreeNode:
+        """
+        Convert the subtree rooted at a node back into TreeNode objects.
+
+        Contents are shared with the arena, not copied.
+
+        Args:
+            idx (int, optional): Index of the subtree root. Defaults to 0 (the root).
+
+        Returns:
+            TreeNode: The root of the rebuilt subtree
+        """
+        names = self._arena.names
+        contents = self._arena.contents
+        root = TreeNode(names[idx], contents[idx])
+        stack = [(idx, root)]
+        while stack:
+            current, node = stack.pop()
+            for child in self.children(current):
+                child_node = TreeNode(names[child], contents[child])
+                node.add_child(child_node)
+                stack.append((child, child_node))
+        return root
+
+    def __repr__(self):
+        """
+        Return a string representation of the ArenaTree.
+
+        Returns:
+            str: A string showing the root name and the number of nodes
+        """
+        return f"ArenaTree(root={self._arena.names[0]}, nodes={len(self._arena)})"
+
+_node_children = attrgetter("children")
+_node_name = attrgetter("name")
+_node_content = attrgetter("content")
+_dict_name = itemgetter("name")
+
+
+def _dict_children(data: Dict) -> List[Dict]:
+    """Return the child dictionaries of a node in dictionary form."""
+    return data.get('children', ())
+
+
+def _dict_content(data: Dict) -> Any:
+    """Return the content of a node in dictionary form."""
+    return data.get('content')
+
+
+def _iter_preorder(root: TreeNode):
+    """
+    Yield a subtree's nodes in depth-first pre-order.
+
+    The walk follows the child, sibling and parent links directly, so it
+    needs neither recursion nor a stack of pending nodes.
+
+    Args:
+        root (TreeNode): The root of the subtree
+    """
+    node = root
+    while True:
+        yield node
+        if node.first_child is not None:
+            node = node.first_child
+            continue
+        while node is not root and node.next_sibling is None:
+            node = node.parent
+        if node is root:
+            return
+        node = node.next_sibling
+
+
+def _precedes(first: TreeNode, second: TreeNode) -> bool:
+    """
+    Tell whether one node comes before another in depth-first pre-order.
+    
+    The nodes must belong to the same tree. The ancestors of first are
+    collected, then second climbs until it meets one of them; the two
+    branches below that common ancestor are ordered by following sibling
+    links.
+    
+    Args:
+        first (TreeNode): The node expected to come first
+        second (TreeNode): The node expected to come second
+        
+    Returns:
+        bool: True if first is visited before second
+    """
+    # Map each ancestor of first (and first itself) to the child on the path
+    path = {id(first): None}
+    below = first
+    node = first.parent
+    while node is not None:
+        path[id(node)] = below
+        below = node
+        node = node.parent
+    below = None
+    node = second
+    while id(node) not in path:
+        below = node
+        node = node.parent
+    if node is second:
+        # second is first itself or one of its ancestors
+        return False
+    if node is first:
+        return True
+    # The branches towards first and second split below node
+    branch = path[id(node)]
+    while branch is not None:
+        if branch is below:
+            return True
+        branch = branch.next_sibling
+    return False
+
+
+def _deepcopy_content(value: Any, memo: Dict) -> Any:
+    """
+    Deep copy a node's content with the result of copy.deepcopy().
+
+    Immutable atoms and tuples of them are returned unchanged, and plain
+    dicts and lists are copied here, registering each copy in the memo
+    just as copy.deepcopy() does; everything else is handed to
+    copy.deepcopy() with the same memo. JSON-like contents thus skip the
+    generic dispatcher entirely, while objects referenced more than once
+    are still copied only once.
+
+    Args:
+        value (Any): The content to copy
+        memo (Dict): The copy.deepcopy() memo dictionary
+
+    Returns:
+        Any: The copied content
+    """
+    cls = value.__class__
+    if cls in _ATOMIC_TYPES:
+        return value
+    if cls is tuple:
+        # A tuple of atoms is immutable all the way down and is shared, as
+        # copy.deepcopy() would; other tuples may hold mutable items
+        for item in value:
+            if item.__class__ not in _ATOMIC_TYPES:
+                return copy.deepcopy(value, memo)
+        return value
+    if cls is not dict and cls is not list:
+        return copy.deepcopy(value, memo)
+    copied = memo.get(id(value))
+    if copied is not None:
+        return copied
+    if cls is list:
+        copied = memo[id(value)] = []
+        append = copied.append
+        for item in value:
+            append(item if item.__class__ in _ATOMIC_TYPES else _deepcopy_content(item, memo))
+        return copied
+    copied = memo[id(value)] = {}
+    for key, item in value.items():
+        if key.__class__ not in _ATOMIC_TYPES:
+            key = copy.deepcopy(key, memo)
+        copied[key] = item if item.__class__ in _ATOMIC_TYPES else _deepcopy_content(item, memo)
+    return copied
+
+
+def _intern_str(value: Any) -> Any:
+    """
+    Return the interned equivalent of a string, or the value unchanged.
+
+    Only exact str objects are interned: other hashable values may compare
+    equal while being distinguishable (1 and True, 0.0 and -0.0), so they
+    cannot safely be shared.
+    """
+    if type(value) is str:
+        return sys.intern(value)
+    return value
+
+
+# Arena size from which Numba kernels or NumPy array passes are used
+_JIT_MIN_NODES = 10000
+
+# Compiled kernels by name; None marks that Numba is unavailable
+_JIT_KERNELS: Dict[str, Any] = {}
+
+
+def _max_depth_kernel(parent) -> int:
+    """
+    Return the maximum depth of an arena from its parent index array.
+    
+    Written for numba.njit: a single forward pass, relying on every node
+    being stored after its parent.
+    """
+    depth = np.ones(parent.shape[0], np.int32)
+    deepest = 1
+    for i in range(1, parent.shape[0]):
+        d = depth[parent[i]] + 1
+        depth[i] = d
+        if d > deepest:
+            deepest = d
+    return deepest
+
+
+def _max_depth_numpy(parent) -> int:
+    """
+    Return the maximum depth of an arena from its parent index array.
+    
+    A forward pass cannot be vectorised, since each depth depends on the
+    one before it. Instead every node keeps a distance to an ancestor and
+    jumps to that ancestor's ancestor on each step, so the distances reach
+    the root after a logarithmic number of whole-array passes.
+    """
+    ancestor = parent.astype(np.intp)
+    ancestor[0] = 0
+    distance = np.ones(ancestor.shape[0], np.intp)
+    distance[0] = 0
+    while ancestor.any():
+        distance += distance[ancestor]
+        ancestor = ancestor[ancestor]
+    return int(distance.max()) + 1
+
+
+def _jit_kernel(name: str):
+    """
+    Return the Numba-compiled version of an arena kernel, or None.
+    
+    Numba is imported on first use rather than with this module, since
+    importing it takes far longer than the rest of the package.
+    
+    Args:
+        name (str): The kernel name, such as "max_depth"
+        
+    Returns:
+        Optional[Callable]: The compiled kernel, or None if Numba or NumPy
+                           is not installed
+    """
+    if name not in _JIT_KERNELS:
+        try:
+            import numba
+        except ImportError:
+            numba = None
+        kernel = None
+        if numba is not None and np is not None:
+            kernel = numba.njit(cache=True)(globals()[f"_{name}_kernel"])
+        _JIT_KERNELS[name] = kernel
+    return _JIT_KERNELS[name]
+
+
+def _bfs_arena(root, children_of, name_of, content_of, size: int) -> _Arena:
+    """
+    Build a compact arena by visiting a tree in breadth-first order.
+
+    The source tree is accessed only through the given callables, so both
+    TreeNode trees and plain dictionaries can be converted. The node count
+    must be known in advance: all arrays are allocated once at their final
+    size and filled by index, so they never have to grow.
+
+    Args:
+        root: The root of the source tree
+        children_of (Callable): Returns the children of a source node, in order
+        name_of (Callable): Returns the name of a source node
+        content_of (Callable): Returns the content of a source node
+        size (int): The number of nodes in the source tree
+
+    Returns:
+        _Arena: The new arena, in the compact layout
+    """
+    arena = _Arena()
+    arena._ensure_capacity(size)
+    names = arena.names
+    contents = arena.contents
+    parents = arena.parent
+    child_start = array('i', [0]) * size
+    child_count = array('i', [0]) * size
+    names[0] = name_of(root)
+    contents[0] = content_of(root)
+    # Breadth-first order is index order, so the sources double as the queue
+    sources = [None] * size
+    sources[0] = root
+    tail = 1
+    for idx in range(size):
+        start = tail
+        for child in children_of(sources[idx]):
+            names[tail] = name_of(child)
+            contents[tail] = content_of(child)
+            parents[tail] = idx
+            sources[tail] = child
+            tail += 1
+        child_start[idx] = start
+        child_count[idx] = tail - start
+    arena.first_child = arena.last_child = arena.next_sibling = None
+    arena.child_start = child_start
+    arena.child_count = child_count
+    return arena
+
+
+def _count_dicts(data: Dict) -> int:
+    """
+    Count the nodes of a tree in dictionary form without recursion.
+    """
+    total = 0
+    stack = [data]
+    while stack:
+        item = stack.pop()
+        total += 1
+        stack.extend(item.get('children', ()))
+    return total
+
+
+def _read_json(filepath: str) -> Any:
+    """
+    Parse a JSON file, with orjson if it is installed.
+    
+    With orjson the file is memory-mapped and parsed in place, so no
+    bytes copy of the whole file is held alongside the parsed result.
+    """
+    if orjson is not None:
+        with open(filepath, 'rb') as f:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                # Empty files and special files cannot be mapped
+                data = f.read()
+                if _LONG_DIGITS.search(data) is None:
+                    try:
+                        return orjson.loads(data)
+                    except orjson.JSONDecodeError:
+                        pass
+                return json.loads(data)
+            with mapped, memoryview(mapped) as view:
+                if _LONG_DIGITS.search(view) is None:
+                    try:
+                        return orjson.loads(view)
+                    except orjson.JSONDecodeError:
+                        # NaN/Infinity literals are only accepted by the json module
+                        pass
+                return json.loads(mapped[:])
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _orjson_safe(value: Any) -> bool:
+    """
+    Tell whether orjson encodes a value exactly as json.dumps does.
+
+    Only values built from dicts, lists, tuples, strings, integers,
+    booleans and None, as themselves, keys or items, qualify. The exact
+    type is checked: orjson natively encodes datetimes, UUIDs, dataclasses,
+    enums and subclasses that the json module rejects or writes differently,
+    and it formats floats differently from json.dumps (1e16 for 1e+16) and
+    writes NaN and Infinity as null, so all other values are left to the
+    json module.
+    """
+    stack = [value]
+    seen = set()
+    while stack:
+        item = stack.pop()
+        kind = item.__class__
+        if kind in _ORJSON_SCALAR_TYPES:
+            continue
+        if kind is not dict and kind is not list and kind is not tuple:
+            return False
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        if kind is dict:
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        else:
+            stack.extend(item)
+    return True
+
+
+def _encode_json(value: Any, indent: bytes) -> bytes:
+    """
+    Encode a value as UTF-8 JSON with 2-space indentation.
+    
+    Args:
+        value (Any): The value to encode
+        indent (bytes): Indentation added to every line after the first
+        
+    Returns:
+        bytes: The encoded value
+    """
+    if value.__class__ is str:
+        # The common case: no indentation applies, and this is the exact
+        # escaping both json.dumps(ensure_ascii=False) and orjson produce
+        return _encode_basestring(value).encode('utf-8')
+    encoded = None
+    if orjson is not None and _orjson_safe(value):
+        try:
+            encoded = orjson.dumps(value, option=_ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            pass
+    if encoded is None:
+        encoded = json.dumps(value, ensure_ascii=False, indent=2).encode('utf-8')
+    if indent and b"\n" in encoded:
+        encoded = encoded.replace(b"\n", b"\n" + indent)
+    return encoded
+
+def _write_json(root: TreeNode, write):
+    """
+    Write a subtree as JSON in the layout of json.dump(root.to_dict(), indent=2).
+    
+    The tree is walked with an explicit stack holding either nodes still
+    to be written or the closing brackets of nodes whose children are
+    being written.
+    
+    Args:
+        root (TreeNode): The root of the subtree to write
+        write (Callable[[bytes], Any]): Function receiving the encoded chunks
+    """
+    stack = [(root, 0, True)]
+    while stack:
+        node, depth, is_last = stack.pop()
+        if node.__class__ is bytes:
+            write(node)
+            continue
+        pad = b" " * (4 * depth)
+        inner = pad + b"  "
+        end = b"\n" + pad + b"}" if is_last else b"\n" + pad + b"},\n"
+        write(pad + b"{\n" + inner + b'"name": ' + _encode_json(node.name, inner)
+              + b",\n" + inner + b'"content": ' + _encode_json(node.content, inner)
+              + b",\n" + inner + b'"children": ')
+        child = node.last_child
+        if child is None:
+            write(b"[]" + end)
+            continue
+        write(b"[\n")
+        stack.append((b"\n" + inner + b"]" + end, depth, is_last))
+        stack.append((child, depth + 1, True))
+        child = child.prev_sibling
+        while child is not None:
+            stack.append((child, depth + 1, False))
+            child = child.prev_sibling
+
+# Line heads and child prefixes drawn by draw_tree()
+_DRAW_LAST = "\u2514\u2500\u2500 "
+_DRAW_MIDDLE = "\u251c\u2500\u2500 "
+_DRAW_GAP = "    "
+_DRAW_PIPE = "\u2502   "
+
+def _render_tree(node: TreeNode, prefix: str = "", is_last: bool = True, key: str = None) -> List[str]:
+    """
+    Render the lines that draw_tree() prints for a subtree.
+    
+    Args:
+        node (TreeNode): The root node of the tree/subtree to render
+        prefix (str, optional): The prefix string for indentation of the
+                               first line. Defaults to "".
+        is_last (bool, optional): Whether the given node is drawn as the last
+                                child of its parent. Defaults to True.
+        key (str, optional): The dictionary key to display for dictionary content.
+                           Defaults to None, which displays no content.
+                           
+    Returns:
+        List[str]: One string per node, without line endings
+    """
+    lines = []
+    append = lines.append
+    # Each entry carries the finished head of its own line and the prefix
+    # of its children's lines; both are built once per parent, not per node
+    if is_last:
+        stack = [(node, prefix + _DRAW_LAST, prefix + _DRAW_GAP)]
+    else:
+        stack = [(node, prefix + _DRAW_MIDDLE, prefix + _DRAW_PIPE)]
+    while stack:
+        current, head, child_prefix = stack.pop()
+        content = current.content
+        if key is not None and isinstance(content, dict) and key in content:
+            content_display = content[key]
+        else:
+            content_display = None
+        if content_display is None:
+            append(f"{head}{current.name}")
+        else:
+            append(f"{head}{current.name}: {content_display}")
+        child = current.last_child
+        if child is None:
+            continue
+        stack.append((child, child_prefix + _DRAW_LAST, child_prefix + _DRAW_GAP))
+        children = current.children
+        if len(children) > 1:
+            middle_head = child_prefix + _DRAW_MIDDLE
+            middle_prefix = child_prefix + _DRAW_PIPE
+            for child in reversed(children[:-1]):
+                stack.append((child, middle_head, middle_prefix))
+    return lines
+
+def draw_tree(node: TreeNode, prefix: str = "", is_last: bool = True, key: str = None,
+              file: Optional[TextIO] = None):
     """
     Print an ASCII art representation of a tree structure.
     
-    This function recursively prints a tree using Unicode box-drawing
-    characters to show the hierarchical structure. It handles special
-    formatting for dictionary content with a specified key.
+    This function renders the tree using Unicode box-drawing characters
+    to show the hierarchical structure and writes all lines to the output
+    stream in a single call. It handles special formatting for dictionary
+    content with a specified key.
     
     Args:
         node (TreeNode): The root node of the tree/subtree to draw
-        prefix (str, optional): The prefix string for indentation. 
-                               Used internally for recursion. Defaults to "".
-        is_last (bool, optional): Whether this node is the last child
-                                of its parent. Used internally for recursion.
-                                Defaults to True.
+        prefix (str, optional): The prefix string for indentation of the
+                               first line. Defaults to "".
+        is_last (bool, optional): Whether the given node is drawn as the last
+                                child of its parent. Defaults to True.
         key (str, optional): The dictionary key to display for dictionary content.
                            If the node's content is a dictionary containing this key,
                            that value will be displayed instead of the entire dictionary.
-                           Defaults to None.
+                           Defaults to None, which displays names only.
+        file (TextIO, optional): The stream to write to. Defaults to None,
+                                which writes to sys.stdout.
                                 
     Example:
         >>> root = TreeNode("Company", "Acme Corp")
@@ -937,15 +2597,19 @@ def draw_tree(node: TreeNode, prefix: str = "", is_last: bool = True, key: str =
     Note:
         If node.content is a dictionary containing the specified key,
         that value will be displayed instead of the entire dictionary.
+        Without a key no content is displayed, not even under a None key
+        of a content dictionary, so the drawing depends only on names and
+        structure; it is kept on the node and reused until any node is
+        renamed or relinked.
     """
-    connector = "\u2514\u2500\u2500 " if is_last else "\u251c\u2500\u2500 "
-    content_display = None
-    if isinstance(node.content, dict) and key in node.content:
-        content_display = node.content[key]
-    if content_display is None:
-        print(prefix + connector + f"{node.name}")
-    else:
-        print(prefix + connector + f"{node.name}: {content_display}")
-    new_prefix = prefix + ("    " if is_last else "│   ")
-    for i, child in enumerate(node.children):
-        draw_tree(child, new_prefix, i == len(node.children) - 1, key)
\ No newline at end of file
+    if file is None:
+        file = sys.stdout
+    if key is not None:
+        file.write("\n".join(_render_tree(node, prefix, is_last, key)) + "\n")
+        return
+    version = TreeNode._structure_version
+    cached = node._render_cache
+    if cached is None or cached[:3] != (version, prefix, is_last):
+        text = "\n".join(_render_tree(node, prefix, is_last)) + "\n"
+        cached = node._render_cache = (version, prefix, is_last, text)
+    file.write(cached[3])
\ No newline at end of file
@@ -6,12 +6,64 @@ and an information viewer panel on the right, allowing interactive exploration
 of tree data structures.
 """
 import json
-import copy
 import tkinter as tk
+from collections import deque
+from contextlib import contextmanager
 from tkinter import ttk, scrolledtext, filedialog, messagebox
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Deque, Dict, Any, List, Tuple
 from flextree import TreeNode, Tree
 
+# Tcl procedure returning the item IDs of a treeview in pre-order, each
+# followed by its open state, so that capturing the expansion state takes
+# one call into Tcl instead of two per item
+_TCL_OPEN_STATES = """
+proc ::flextree_open_states {tv} {
+    set result {}
+    set stack [lreverse [$tv children {}]]
+    while {[llength $stack]} {
+        set item [lindex $stack end]
+        set stack [lreplace $stack end end]
+        lappend result $item [$tv item $item -open]
+        foreach child [lreverse [$tv children $item]] {
+            lappend stack $child
+        }
+    }
+    return $result
+}
+"""
+
+
+# Characters a JSON document can start with: the quote of a string literal,
+# so text like "42" is still stored as a string, objects, arrays, numbers,
+# true/false/null and the NaN and Infinity literals json.loads() accepts;
+# the empty string is not included
+_JSON_START = frozenset('"' '{[' '-0123456789' 'tfn' 'NI')
+
+# Exact types of JSON scalars, which content copies share instead of copying
+_SCALAR_TYPES = frozenset((type(None), bool, int, float, str))
+
+
+def _copy_content(content):
+    """
+    Copy the dicts, lists and tuples of a content value, sharing everything else.
+    
+    Scalars inside containers are recognised by exact type and kept without
+    a further call, which covers most values of JSON-like content.
+    """
+    if content.__class__ in _SCALAR_TYPES:
+        return content
+    if isinstance(content, dict):
+        return {k: v if v.__class__ in _SCALAR_TYPES else _copy_content(v)
+                for k, v in content.items()}
+    elif isinstance(content, list):
+        return [item if item.__class__ in _SCALAR_TYPES else _copy_content(item)
+                for item in content]
+    elif isinstance(content, tuple):
+        return tuple(item if item.__class__ in _SCALAR_TYPES else _copy_content(item)
+                     for item in content)
+    else:
+        return content
+
 
 class ActionMemorySystem:
     """
@@ -22,6 +74,17 @@ class ActionMemorySystem:
     tree expansion state. It supports up to 20 steps of history.
     """
     
+    # Status bar text for each action type
+    _DESCRIPTIONS = {
+        'cut': 'Cut node',
+        'copy': 'Copy node', 
+        'paste': 'Paste node',
+        'delete': 'Delete node',
+        'insert': 'Insert new node',
+        'rename': 'Rename node',
+        'content_edit': 'Edit node content'
+    }
+    
     def __init__(self, max_steps: int = 20):
         """
         Initialize the action memory system.
@@ -30,7 +93,8 @@ class ActionMemorySystem:
             max_steps: Maximum number of action steps to remember
         """
         self.max_steps = max_steps
-        self.action_history: List[Dict[str, Any]] = []
+        # Bounded: appending beyond max_steps drops the oldest action
+        self.action_history: Deque[Dict[str, Any]] = deque(maxlen=max_steps)
         self.current_index = -1  # -1 means no actions yet
         
     def record_action(self, action_type: str, tree_state_before: Tree, 
@@ -43,12 +107,14 @@ class ActionMemorySystem:
             action_type: Type of action performed (e.g., 'cut', 'copy', 'paste', 'delete', 'insert', 'rename', 'content_edit')
             tree_state_before: Deep copy of the tree state before the action
             selected_node_name: Name of the selected node when action was performed
-            expansion_state: Current expansion state and selection
+            expansion_state: Current expansion state and selection. It is stored
+                as given, not copied, so callers must pass a dict they no longer
+                modify, such as a fresh one from _capture_expansion_state()
             action_data: Additional data specific to the action type
         """
         # Remove any actions after current index (when we're in the middle of history)
-        if self.current_index >= 0:
-            self.action_history = self.action_history[:self.current_index + 1]
+        while len(self.action_history) > self.current_index + 1:
+            self.action_history.pop()
         
         # Create action record
         action_record = {
@@ -63,15 +129,9 @@ class ActionMemorySystem:
             'timestamp': None  # Could add timestamp if needed
         }
         
-        # Add to history
+        # Add to history; beyond max_steps the deque drops the oldest action
         self.action_history.append(action_record)
         
-        # Maintain max steps limit
-        if len(self.action_history) > self.max_steps:
-            self.action_history.pop(0)
-            if self.current_index >= 0:
-                self.current_index = min(self.current_index, len(self.action_history) - 1)
-        
         # Update current index
         self.current_index = len(self.action_history) - 1
     
@@ -118,7 +178,7 @@ class ActionMemorySystem:
     
     def clear_history(self):
         """Clear all action history."""
-        self.action_history = []
+        self.action_history.clear()
         self.current_index = -1
     
     def get_current_action_description(self) -> str:
@@ -129,17 +189,7 @@ class ActionMemorySystem:
         action = self.action_history[self.current_index]
         action_type = action['action_type']
         
-        descriptions = {
-            'cut': 'Cut node',
-            'copy': 'Copy node', 
-            'paste': 'Paste node',
-            'delete': 'Delete node',
-            'insert': 'Insert new node',
-            'rename': 'Rename node',
-            'content_edit': 'Edit node content'
-        }
-        
-        return descriptions.get(action_type, f'Unknown action: {action_type}')
+        return self._DESCRIPTIONS.get(action_type, f'Unknown action: {action_type}')
 
 
 class TreeViewerPanel(ttk.Frame):
@@ -164,6 +214,7 @@ class TreeViewerPanel(ttk.Frame):
         self.clipboard_callbacks = clipboard_callbacks or {}
         self.tree = None
         self.node_map = {}  # Maps treeview item IDs to TreeNode objects
+        self._pending = {}  # Maps item IDs whose children are not inserted yet to their TreeNode
         
         self._setup_ui()
     
@@ -220,9 +271,14 @@ class TreeViewerPanel(ttk.Frame):
         h_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
         self.treeview.pack(fill=tk.BOTH, expand=True)
         
+        self.tk.eval(_TCL_OPEN_STATES)
+        
         # Bind selection event
         self.treeview.bind('<<TreeviewSelect>>', self._on_select)
         
+        # Insert the children of a node when it is first opened
+        self.treeview.bind('<<TreeviewOpen>>', self._on_open)
+        
         # Bind right-click for context menu
         self.treeview.bind('<Button-3>', self._show_context_menu)
     
@@ -243,15 +299,19 @@ class TreeViewerPanel(ttk.Frame):
     def _populate_treeview(self):
         """Populate the treeview with tree data."""
         # Clear existing items
-        for item in self.treeview.get_children():
-            self.treeview.delete(item)
-        self.node_map.clear()
+        self._clear_treeview()
         
         if self.tree:
             self._add_node_to_treeview('', self.tree.root)
             # Automatically select the root node
             self._select_root_node()
     
+    def _clear_treeview(self):
+        """Remove all items from the treeview in a single Tk call."""
+        self.treeview.delete(*self.treeview.get_children())
+        self.node_map.clear()
+        self._pending.clear()
+    
     def _select_root_node(self):
         """Select the root node in the treeview."""
         # Get the first (root) item in the treeview
@@ -267,13 +327,21 @@ class TreeViewerPanel(ttk.Frame):
             if self.on_node_select and root_item_id in self.node_map:
                 self.on_node_select(self.node_map[root_item_id])
     
-    def _add_node_to_treeview(self, parent_id: str, node: TreeNode):
+    def _add_node_to_treeview(self, parent_id: str, node: TreeNode) -> str:
         """
-        Recursively add a node and its children to the treeview.
+        Add a node to the treeview, deferring its children.
+        
+        Only the node itself is inserted. If it has children, an empty
+        placeholder item is inserted under it so that it can be opened, and
+        the real children are inserted by _populate_item() when it is first
+        opened. Loading a tree therefore costs only the nodes shown.
         
         Args:
             parent_id: The parent item ID in the treeview
             node: The TreeNode to add
+            
+        Returns:
+            The item ID of the inserted node
         """
         # Display only the node name (no content preview)
         display_text = node.name
@@ -282,9 +350,112 @@ class TreeViewerPanel(ttk.Frame):
         item_id = self.treeview.insert(parent_id, tk.END, text=display_text)
         self.node_map[item_id] = node
         
-        # Add children
-        for child in node.children:
-            self._add_node_to_treeview(item_id, child)
+        # Defer children behind a placeholder
+        if node.first_child is not None:
+            self.treeview.insert(item_id, tk.END, text="")
+            self._pending[item_id] = node
+        return item_id
+    
+    def _populate_item(self, item_id: str):
+        """
+        Replace the placeholder of an item with its node's children.
+        
+        Does nothing if the children have already been inserted.
+        
+        Args:
+            item_id: The treeview item ID
+        """
+        node = self._pending.pop(item_id, None)
+        if node is None:
+            return
+        self.treeview.delete(*self.treeview.get_children(item_id))
+        # Same as _add_node_to_treeview() per child, with the lookups bound once
+        insert = self.treeview.insert
+        node_map = self.node_map
+        pending = self._pending
+        child = node.first_child
+        while child is not None:
+            child_id = insert(item_id, tk.END, text=child.name)
+            node_map[child_id] = child
+            if child.first_child is not None:
+                insert(child_id, tk.END, text="")
+                pending[child_id] = child
+            child = child.next_sibling
+    
+    def _on_open(self, event):
+        """Handle treeview open event by inserting the opened node's children."""
+        self._populate_item(self.treeview.focus())
+    
+    def _item_for_node(self, target_node: TreeNode, populate: bool = True) -> Optional[str]:
+        """
+        Find the treeview item of a node, inserting its ancestors' children as needed.
+        
+        Args:
+            target_node: The TreeNode to find
+            populate: If False, do not insert any children; a node whose item
+                      has not been inserted yet is then reported as not found
+            
+        Returns:
+            The item ID of the node, or None if it is not in the displayed tree
+        """
+        path = []
+        node = target_node
+        while node is not None:
+            path.append(node)
+            node = node.parent
+        root_items = self.treeview.get_children()
+        if not root_items or self.node_map.get(root_items[0]) is not path[-1]:
+            return None
+        item_id = root_items[0]
+        for node in reversed(path[:-1]):
+            if item_id in self._pending:
+                if not populate:
+                    return None
+                self._populate_item(item_id)
+            for child_id in self.treeview.get_children(item_id):
+                if self.node_map.get(child_id) is node:
+                    item_id = child_id
+                    break
+            else:
+                return None
+        return item_id
+    
+    def _item_for_name(self, name: str) -> Optional[str]:
+        """
+        Find the treeview item of the first node with the given name.
+        
+        Args:
+            name: The node name to find
+            
+        Returns:
+            The item ID of the node, or None if no node has that name
+        """
+        if not self.tree:
+            return None
+        if isinstance(name, str):
+            subtree = self.tree.get(name)
+            node = subtree.root if subtree is not None else None
+        else:
+            # Tree.get() reads other keys as child indices
+            node = next((n for n in self.tree if n.name == name), None)
+        if node is None:
+            return None
+        return self._item_for_node(node)
+    
+    def refresh_node(self, node: TreeNode):
+        """
+        Update the displayed name of a single node in place.
+        
+        Use this instead of load_tree() when only a node's name changed.
+        Nodes whose items have not been inserted yet need no update, since
+        their name is read when they are inserted.
+        
+        Args:
+            node: The TreeNode whose name changed
+        """
+        item_id = self._item_for_node(node, populate=False)
+        if item_id:
+            self.treeview.item(item_id, text=node.name)
     
     def _on_select(self, event):
         """Handle treeview selection event."""
@@ -297,23 +468,28 @@ class TreeViewerPanel(ttk.Frame):
     
     def _expand_all(self):
         """Expand all nodes in the treeview."""
-        def expand_item(item):
-            self.treeview.item(item, open=True)
-            for child in self.treeview.get_children(item):
-                expand_item(child)
-        
-        for item in self.treeview.get_children():
-            expand_item(item)
+        self._expand_items(self.treeview.get_children())
     
     def _collapse_all(self):
         """Collapse all nodes in the treeview."""
-        def collapse_item(item):
+        self._collapse_items(self.treeview.get_children())
+    
+    def _expand_items(self, items):
+        """Expand the given items and everything below them, without recursion."""
+        stack = list(items)
+        while stack:
+            item = stack.pop()
+            self._populate_item(item)
+            self.treeview.item(item, open=True)
+            stack.extend(self.treeview.get_children(item))
+    
+    def _collapse_items(self, items):
+        """Collapse the given items and everything below them, without recursion."""
+        stack = list(items)
+        while stack:
+            item = stack.pop()
             self.treeview.item(item, open=False)
-            for child in self.treeview.get_children(item):
-                collapse_item(child)
-        
-        for item in self.treeview.get_children():
-            collapse_item(item)
+            stack.extend(self.treeview.get_children(item))
     
     def _capture_expansion_state(self) -> Dict[str, Any]:
         """
@@ -332,19 +508,13 @@ class TreeViewerPanel(ttk.Frame):
             if selected_node:
                 selected_node_name = selected_node.name
         
-        def capture_item_state(item_id):
-            node = self.node_map.get(item_id)
+        # Fetch every item with its open state, in pre-order, in one Tcl call;
+        # placeholder items are not in node_map and are skipped
+        states = self.tk.splitlist(self.tk.call('::flextree_open_states', self.treeview))
+        for item_id, is_open in zip(states[0::2], states[1::2]):
+            node = self.node_map.get(str(item_id))
             if node:
-                is_open = self.treeview.item(item_id, 'open')
-                expansion_state[node.name] = is_open
-                
-                # Recursively capture children
-                for child_id in self.treeview.get_children(item_id):
-                    capture_item_state(child_id)
-        
-        # Capture state for all top-level items
-        for item_id in self.treeview.get_children():
-            capture_item_state(item_id)
+                expansion_state[node.name] = self.tk.getboolean(is_open)
             
         return {
             'expansion': expansion_state,
@@ -361,27 +531,33 @@ class TreeViewerPanel(ttk.Frame):
         expansion_state = state_info.get('expansion', {})
         selected_node_name = state_info.get('selection')
         
-        def restore_item_state(item_id):
+        # Walk the items in pre-order with an explicit stack
+        stack = list(reversed(self.treeview.get_children()))
+        while stack:
+            item_id = stack.pop()
             node = self.node_map.get(item_id)
             if node:
+                # Insert the children again if they were shown before, even
+                # collapsed, so that their own expansion state is kept
+                if item_id in self._pending and (
+                        expansion_state.get(node.name)
+                        or any(child.name in expansion_state for child in node.children)):
+                    self._populate_item(item_id)
+                
                 # Restore expansion state
                 if node.name in expansion_state:
                     should_expand = expansion_state[node.name]
                     self.treeview.item(item_id, open=should_expand)
                 
-                # Restore selection if this is the selected node
-                if selected_node_name and node.name == selected_node_name:
-                    self.treeview.selection_set(item_id)
-                    self.treeview.focus(item_id)
-                    self.treeview.see(item_id)
-                
-            # Recursively restore children
-            for child_id in self.treeview.get_children(item_id):
-                restore_item_state(child_id)
+            stack.extend(reversed(self.treeview.get_children(item_id)))
         
-        # Restore state for all top-level items
-        for item_id in self.treeview.get_children():
-            restore_item_state(item_id)
+        # Restore selection; the selected node may be below a collapsed node
+        if selected_node_name:
+            selected_item = self._item_for_name(selected_node_name)
+            if selected_item:
+                self.treeview.selection_set(selected_item)
+                self.treeview.focus(selected_item)
+                self.treeview.see(selected_item)
     
     def _populate_treeview_with_state(self):
         """Populate treeview while preserving expansion and selection state."""
@@ -389,9 +565,7 @@ class TreeViewerPanel(ttk.Frame):
         state_info = self._capture_expansion_state()
         
         # Clear and repopulate
-        for item in self.treeview.get_children():
-            self.treeview.delete(item)
-        self.node_map.clear()
+        self._clear_treeview()
         
         if self.tree:
             self._add_node_to_treeview('', self.tree.root)
@@ -461,21 +635,11 @@ class TreeViewerPanel(ttk.Frame):
     
     def _expand_subtree(self, item):
         """Expand a subtree starting from the given item."""
-        def expand_item(current_item):
-            self.treeview.item(current_item, open=True)
-            for child in self.treeview.get_children(current_item):
-                expand_item(child)
-        
-        expand_item(item)
+        self._expand_items([item])
     
     def _collapse_subtree(self, item):
         """Collapse a subtree starting from the given item."""
-        def collapse_item(current_item):
-            for child in self.treeview.get_children(current_item):
-                collapse_item(child)
-            self.treeview.item(current_item, open=False)
-        
-        collapse_item(item)
+        self._collapse_items([item])
 
 
 class InfoViewerPanel(ttk.Frame):
@@ -495,6 +659,7 @@ class InfoViewerPanel(ttk.Frame):
         """
         super().__init__(parent)
         self.current_node = None
+        self._name_tree: Optional[Tree] = None  # Tree over the current root, reused for its name index
         self._setup_ui()
     
     def _setup_ui(self):
@@ -589,13 +754,18 @@ class InfoViewerPanel(ttk.Frame):
         )
         self.edit_toggle_btn.pack(side=tk.LEFT, padx=(0, 5))
         
-        # Add/Remove buttons (initially hidden)
-        self.add_btn = ttk.Button(self.content_toolbar, text="Add", command=self._add_item)
-        self.remove_btn = ttk.Button(self.content_toolbar, text="Remove", command=self._remove_item)
-        self.clear_btn = ttk.Button(self.content_toolbar, text="Clear", command=self._clear_content)
-        self.create_new_btn = ttk.Button(self.content_toolbar, text="Create New", command=self._create_new_content)
-        self.save_btn = ttk.Button(self.content_toolbar, text="Save Changes", command=self._save_changes)
-        self.cancel_btn = ttk.Button(self.content_toolbar, text="Cancel", command=self._cancel_changes)
+        # Add/Remove buttons, laid out once in a frame that is shown and
+        # hidden as a whole (initially hidden)
+        self.edit_buttons_frame = ttk.Frame(self.content_toolbar)
+        self.add_btn = ttk.Button(self.edit_buttons_frame, text="Add", command=self._add_item)
+        self.remove_btn = ttk.Button(self.edit_buttons_frame, text="Remove", command=self._remove_item)
+        self.clear_btn = ttk.Button(self.edit_buttons_frame, text="Clear", command=self._clear_content)
+        self.create_new_btn = ttk.Button(self.edit_buttons_frame, text="Create New", command=self._create_new_content)
+        self.save_btn = ttk.Button(self.edit_buttons_frame, text="Save Changes", command=self._save_changes)
+        self.cancel_btn = ttk.Button(self.edit_buttons_frame, text="Cancel", command=self._cancel_changes)
+        for button in (self.add_btn, self.remove_btn, self.clear_btn,
+                       self.create_new_btn, self.save_btn, self.cancel_btn):
+            button.pack(side=tk.LEFT, padx=(0, 5))
         
         # Create a frame that will contain either table or text
         self.content_container = ttk.Frame(content_frame)
@@ -608,6 +778,10 @@ class InfoViewerPanel(ttk.Frame):
         self.content_display_mode = "text"
         self.is_editing = False
         self.original_content = None  # Store original content for cancel functionality
+        self._path_cache: Dict[str, List[str]] = {}  # Content table item -> key path, valid until the rows are rebuilt
+        self._container_cache: Dict[str, Any] = {}  # Content table item -> value at its path, same lifetime
+        self._update_depth = 0  # Nesting level of _batch_updates blocks
+        self._update_dirty = False  # A content refresh was deferred by _batch_updates
 
         # Note: Ctrl+E binding is now handled globally by the main UI
 
@@ -620,31 +794,21 @@ class InfoViewerPanel(ttk.Frame):
         if self.is_editing:
             # Record action for undo/redo before making changes
             if hasattr(self, 'record_action'):
-                action_data = {'node_name': self.current_node.name, 'old_content': copy.deepcopy(self.original_content)}
+                action_data = {'node_name': self.current_node.name, 'old_content': self._deep_copy_content(self.original_content)}
                 self.record_action('content_edit', action_data)
             
             # Store original content for cancel functionality
             self.original_content = self._deep_copy_content(self.current_node.content)            
 
             # Show edit buttons
-            self.add_btn.pack(side=tk.LEFT, padx=(0, 5))
-            self.remove_btn.pack(side=tk.LEFT, padx=(0, 5))
-            self.clear_btn.pack(side=tk.LEFT, padx=(0, 5))
-            self.create_new_btn.pack(side=tk.LEFT, padx=(0, 5))
-            self.save_btn.pack(side=tk.LEFT, padx=(0, 5))
-            self.cancel_btn.pack(side=tk.LEFT, padx=(0, 5))
+            self.edit_buttons_frame.pack(side=tk.LEFT)
             
             # Enable text editing if in text mode
             if self.content_display_mode == "text" and hasattr(self, 'content_text'):
                 self.content_text.config(state=tk.NORMAL)
         else:
             # Hide edit buttons
-            self.add_btn.pack_forget()
-            self.remove_btn.pack_forget()
-            self.clear_btn.pack_forget()
-            self.create_new_btn.pack_forget()
-            self.save_btn.pack_forget()
-            self.cancel_btn.pack_forget()
+            self.edit_buttons_frame.pack_forget()
             
             # Disable text editing if in text mode
             if self.content_display_mode == "text" and hasattr(self, 'content_text'):
@@ -660,14 +824,7 @@ class InfoViewerPanel(ttk.Frame):
     
     def _deep_copy_content(self, content):
         """Create a deep copy of content for backup."""
-        if isinstance(content, dict):
-            return {k: self._deep_copy_content(v) for k, v in content.items()}
-        elif isinstance(content, list):
-            return [self._deep_copy_content(item) for item in content]
-        elif isinstance(content, tuple):
-            return tuple(self._deep_copy_content(item) for item in content)
-        else:
-            return content
+        return _copy_content(content)
     
     def _save_changes(self):
         """Save changes to the node content."""
@@ -680,6 +837,9 @@ class InfoViewerPanel(ttk.Frame):
                 text_content = self.content_text.get(1.0, tk.END).strip()
                 if text_content == "No content":
                     new_content = None
+                elif text_content[:1] not in _JSON_START:
+                    # Cannot be JSON, so skip the failing parse
+                    new_content = text_content
                 else:
                     try:
                         # Try to parse as JSON
@@ -701,10 +861,10 @@ class InfoViewerPanel(ttk.Frame):
             self.edit_mode_var.set(False)
             self._toggle_edit_mode()
             
-            # Refresh all displays to reflect changes
+            # Refresh the content display; leaving edit mode above already
+            # refreshed the overview, and a content edit cannot change the
+            # children listed in the children tab
             self._update_content()
-            self._update_overview()  # Update overview tab to reflect content changes
-            self._update_children()  # Update children tab in case structure changed
             
             # Notify that content has changed
             if hasattr(self, 'content_changed_callback') and self.content_changed_callback:
@@ -729,10 +889,10 @@ class InfoViewerPanel(ttk.Frame):
         self.edit_mode_var.set(False)
         self._toggle_edit_mode()
         
-        # Refresh all displays to reflect reverted state
+        # Refresh the content display; leaving edit mode above already
+        # refreshed the overview, and reverting content cannot change the
+        # children listed in the children tab
         self._update_content()
-        self._update_overview()  # Update overview tab to reflect reverted content
-        self._update_children()  # Update children tab in case structure changed
     
     def _revert_to_original(self):
         """Revert current node content to original state."""
@@ -752,19 +912,37 @@ class InfoViewerPanel(ttk.Frame):
         # Not editing -> no unsaved changes
         return False
     
-    def _content_equals(self, content1, content2):
-        """Deep comparison of two content objects."""
+    def _content_equals(self, content1, content2, _memo=None):
+        """
+        Deep comparison of two content objects.
+        
+        Container pairs are remembered by identity for the duration of one
+        comparison. A pair met again is either already known to be equal or
+        still being compared, since any difference ends the comparison, so
+        shared substructures are walked once and cycles terminate.
+        """
+        # The same object is unchanged, without walking it
+        if content1 is content2:
+            return True
         if type(content1) != type(content2):
             return False
         
+        if isinstance(content1, (dict, list, tuple)):
+            if _memo is None:
+                _memo = set()
+            key = (id(content1), id(content2))
+            if key in _memo:
+                return True
+            _memo.add(key)
+        
         if isinstance(content1, dict):
             if set(content1.keys()) != set(content2.keys()):
                 return False
-            return all(self._content_equals(content1[k], content2[k]) for k in content1.keys())
+            return all(self._content_equals(content1[k], content2[k], _memo) for k in content1.keys())
         elif isinstance(content1, (list, tuple)):
             if len(content1) != len(content2):
                 return False
-            return all(self._content_equals(a, b) for a, b in zip(content1, content2))
+            return all(self._content_equals(a, b, _memo) for a, b in zip(content1, content2))
         else:
             return content1 == content2
     
@@ -798,7 +976,7 @@ class InfoViewerPanel(ttk.Frame):
         x, y, width, height = bbox
 
         # Create an Entry widget over the cell
-        entry = ttk.Entry(self.overview_table, width=max(10, width // 8))
+        entry = ttk.Entry(self.overview_table)
         entry.insert(0, current_name)
         entry.select_range(0, tk.END)
         entry.focus()
@@ -836,13 +1014,38 @@ class InfoViewerPanel(ttk.Frame):
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to rename node:\n{str(e)}")
 
-        def cancel_edit(event=None):
-            entry.destroy()
-
-        entry.bind('<Return>', finish_edit)
-        entry.bind('<Escape>', cancel_edit)
-        entry.bind('<FocusOut>', cancel_edit)
+        self._bind_inline_edit(entry, finish_edit)
 
+    def _bind_inline_edit(self, entry, finish_edit):
+        """
+        Bind Return, Escape and FocusOut on an inline edit entry.
+        
+        Only the first of these events acts. Destroying the entry or showing
+        a message box moves the focus away, and the FocusOut that follows
+        must not run a second handler.
+        
+        Args:
+            entry: The Entry widget placed over the edited cell
+            finish_edit: Callback that commits the edit and destroys the entry
+        """
+        done = False
+        
+        def finish(event=None):
+            nonlocal done
+            if not done:
+                done = True
+                finish_edit(event)
+        
+        def cancel(event=None):
+            nonlocal done
+            if not done:
+                done = True
+                entry.destroy()
+        
+        entry.bind('<Return>', finish)
+        entry.bind('<Escape>', cancel)
+        entry.bind('<FocusOut>', cancel)
+    
     def _is_name_unique_in_tree(self, name):
         """Check if the given name is unique in the entire tree."""
         if not self.current_node:
@@ -853,18 +1056,28 @@ class InfoViewerPanel(ttk.Frame):
         while root.parent:
             root = root.parent
         
+        # Keep one Tree per root so its name index survives between checks
+        if self._name_tree is None or self._name_tree.root is not root:
+            self._name_tree = Tree(root)
+        if name not in self._name_tree:
+            return True
+        if name != self.current_node.name:
+            return False
+        
         # Check if name exists anywhere in the tree (except current node)
         return not self._name_exists_in_subtree(root, name, self.current_node)
     
     def _name_exists_in_subtree(self, node, name, exclude_node):
-        """Recursively check if name exists in subtree, excluding a specific node."""
-        if node != exclude_node and node.name == name:
-            return True
-        
-        for child in node.children:
-            if self._name_exists_in_subtree(child, name, exclude_node):
+        """Check if name exists in subtree, excluding a specific node, without recursion."""
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if node is not exclude_node and node.name == name:
                 return True
-        
+            child = node.first_child
+            while child is not None:
+                stack.append(child)
+                child = child.next_sibling
         return False
     
     def _notify_node_renamed(self, old_name, new_name):
@@ -1015,7 +1228,7 @@ class InfoViewerPanel(ttk.Frame):
                         elif isinstance(parent_container, list):
                             if len(parent_container) > 0 and isinstance(parent_container[0], dict):
                                 # Add new dict item with same keys as first item
-                                new_item = {k: "(new value)" for k in parent_container[0].keys()}
+                                new_item = dict.fromkeys(parent_container[0], "(new value)")
                             else:
                                 # For any other list type (including empty), append a simple value
                                 new_item = "(new value)"
@@ -1044,7 +1257,7 @@ class InfoViewerPanel(ttk.Frame):
            len(self.current_node.content) > 0 and \
            isinstance(self.current_node.content[0], dict):
             # Adding to list of dictionaries
-            new_item = {key: "(new value)" for key in self.current_node.content[0].keys()}
+            new_item = dict.fromkeys(self.current_node.content[0], "(new value)")
             self.current_node.content.append(new_item)
             self._update_content()
         else:
@@ -1113,8 +1326,9 @@ class InfoViewerPanel(ttk.Frame):
             # Check if value is a dict or list (should use nested editor)
             if isinstance(current_value, (dict, list)):
                 # For nested structures, show a dialog to edit as JSON
-                dialog = EditValueDialog(self.content_container, json.dumps(current_value, ensure_ascii=False), "Edit Value")
-                if dialog.result is not None and dialog.result != json.dumps(current_value, ensure_ascii=False):
+                serialized = json.dumps(current_value, ensure_ascii=False)
+                dialog = EditValueDialog(self.content_container, serialized, "Edit Value")
+                if dialog.result is not None and dialog.result != serialized:
                     try:
                         parsed_value = json.loads(dialog.result)
                         self._set_nested_value(key, parent, parsed_value)
@@ -1123,7 +1337,7 @@ class InfoViewerPanel(ttk.Frame):
                         messagebox.showerror("Error", f"Invalid JSON format:\n{str(e)}")
             else:
                 # Simple value - use inline editing
-                entry = ttk.Entry(self.content_table, width=max(10, width // 8))
+                entry = ttk.Entry(self.content_table)
                 entry.insert(0, str(current_value))
                 entry.select_range(0, tk.END)
                 entry.focus()
@@ -1147,16 +1361,11 @@ class InfoViewerPanel(ttk.Frame):
                     except Exception as e:
                         messagebox.showerror("Error", f"Failed to update value:\n{str(e)}")
                 
-                def cancel_edit(event=None):
-                    entry.destroy()
-                
-                entry.bind('<Return>', finish_edit)
-                entry.bind('<Escape>', cancel_edit)
-                entry.bind('<FocusOut>', cancel_edit)
+                self._bind_inline_edit(entry, finish_edit)
             
         elif column == '#0':  # Key column
             # Create an Entry widget over the cell
-            entry = ttk.Entry(self.content_table, width=max(10, width // 8))
+            entry = ttk.Entry(self.content_table)
             entry.insert(0, key)
             entry.select_range(0, tk.END)
             entry.focus()
@@ -1171,28 +1380,16 @@ class InfoViewerPanel(ttk.Frame):
                     messagebox.showerror("Error", "Key cannot be empty.")
                     return
                 
-                # Check if new key already exists in the same parent context
-                if self._key_exists_in_parent(new_key, parent, key):
-                    messagebox.showerror("Error", f"Key '{new_key}' already exists.")
-                    return
-                
                 try:
-                    # Get the value to move
-                    current_value = self._get_nested_value(key, parent)
-                    # Remove old key
-                    self._delete_nested_value(key, parent)
-                    # Add with new key
-                    self._set_nested_value(new_key, parent, current_value)
+                    # Fails if new key already exists in the same parent context
+                    if not self._rename_key(parent, key, new_key):
+                        messagebox.showerror("Error", f"Key '{new_key}' already exists.")
+                        return
                     self._update_content()
                 except Exception as e:
                     messagebox.showerror("Error", f"Failed to rename key:\n{str(e)}")
             
-            def cancel_edit(event=None):
-                entry.destroy()
-            
-            entry.bind('<Return>', finish_edit)
-            entry.bind('<Escape>', cancel_edit)
-            entry.bind('<FocusOut>', cancel_edit)
+            self._bind_inline_edit(entry, finish_edit)
     
     def _get_nested_value(self, key, parent_item):
         """Get value from nested structure using parent item reference."""
@@ -1202,20 +1399,7 @@ class InfoViewerPanel(ttk.Frame):
                 return self.current_node.content.get(key)
         else:
             # Navigate through nested structure
-            path = self._get_path_to_item(parent_item)
-            current = self.current_node.content
-            
-            for path_key in path:
-                if isinstance(current, dict):
-                    current = current.get(path_key)
-                elif isinstance(current, list):
-                    try:
-                        idx = int(path_key)
-                        current = current[idx]
-                    except (ValueError, IndexError):
-                        return None
-                else:
-                    return None
+            current = self._resolve_container(parent_item)
             
             # Now get the final value
             if isinstance(current, dict):
@@ -1237,20 +1421,7 @@ class InfoViewerPanel(ttk.Frame):
                 self.current_node.content[key] = value
         else:
             # Navigate through nested structure
-            path = self._get_path_to_item(parent_item)
-            current = self.current_node.content
-            
-            for path_key in path:
-                if isinstance(current, dict):
-                    current = current.get(path_key)
-                elif isinstance(current, list):
-                    try:
-                        idx = int(path_key)
-                        current = current[idx]
-                    except (ValueError, IndexError):
-                        return
-                else:
-                    return
+            current = self._resolve_container(parent_item)
             
             # Set the final value
             if isinstance(current, dict):
@@ -1269,20 +1440,7 @@ class InfoViewerPanel(ttk.Frame):
                 if key in self.current_node.content:
                     del self.current_node.content[key]
         else:
-            path = self._get_path_to_item(parent_item)
-            current = self.current_node.content
-            
-            for path_key in path:
-                if isinstance(current, dict):
-                    current = current.get(path_key)
-                elif isinstance(current, list):
-                    try:
-                        idx = int(path_key)
-                        current = current[idx]
-                    except (ValueError, IndexError):
-                        return
-                else:
-                    return
+            current = self._resolve_container(parent_item)
             
             if isinstance(current, dict):
                 if key in current:
@@ -1294,45 +1452,78 @@ class InfoViewerPanel(ttk.Frame):
                 except (ValueError, IndexError):
                     return
     
+    def _resolve_container(self, parent_item):
+        """
+        Get the value a content table item stands for, walking its key path once.
+        
+        The result is cached until the table rows are rebuilt, so the get,
+        delete and set steps of one edit share a single walk. Returns None if
+        the path no longer leads anywhere.
+        """
+        try:
+            return self._container_cache[parent_item]
+        except KeyError:
+            pass
+        
+        current = self.current_node.content
+        for path_key in self._get_path_to_item(parent_item):
+            if isinstance(current, dict):
+                current = current.get(path_key)
+            elif isinstance(current, list):
+                try:
+                    current = current[int(path_key)]
+                except (ValueError, IndexError):
+                    return None
+            else:
+                return None
+        
+        self._container_cache[parent_item] = current
+        return current
+    
     def _get_path_to_item(self, item_id):
         """Get the path from root to an item as a list of keys/indices."""
+        path = self._path_cache.get(item_id)
+        if path is not None:
+            return path
+        
         path = []
         current = item_id
         while current != '':
             parent = self.content_table.parent(current)
             key = self.content_table.item(current, 'text')
-            path.insert(0, key)
+            path.append(key)
             current = parent
+        path.reverse()
+        self._path_cache[item_id] = path
         return path
     
-    def _key_exists_in_parent(self, new_key, parent_item, exclude_key):
-        """Check if a key already exists in the parent context."""
-        parent_dict = None
+    def _rename_key(self, parent_item, old_key, new_key):
+        """
+        Rename a key in the container that holds a content table item.
+        
+        The container is resolved once and reused for the existence check
+        and the move. Dict keys are moved with a single pop, so the renamed
+        key ends up last, as it did with a delete followed by a set.
         
+        Returns:
+            bool: False if new_key already exists in the container, True otherwise
+        """
         if parent_item == '':
-            parent_dict = self.current_node.content if isinstance(self.current_node.content, dict) else None
+            container = self.current_node.content
         else:
-            path = self._get_path_to_item(parent_item)
-            current = self.current_node.content
-            
-            for path_key in path:
-                if isinstance(current, dict):
-                    current = current.get(path_key)
-                elif isinstance(current, list):
-                    try:
-                        idx = int(path_key)
-                        current = current[idx]
-                    except (ValueError, IndexError):
-                        return False
-                else:
-                    return False
-            
-            parent_dict = current if isinstance(current, dict) else None
+            container = self._resolve_container(parent_item)
         
-        if parent_dict is None:
-            return False
+        if isinstance(container, dict):
+            if new_key in container:
+                return False
+            container[new_key] = container.pop(old_key, None)
+            return True
         
-        return new_key in parent_dict and new_key != exclude_key
+        # Other containers keep the plain get/delete/set sequence
+        current_value = self._get_nested_value(old_key, parent_item)
+        self._delete_nested_value(old_key, parent_item)
+        self._set_nested_value(new_key, parent_item, current_value)
+        return True
 
     def _edit_list_item(self, row, column):
         """Edit list item with inline editing, supporting nested structures."""
@@ -1349,20 +1540,7 @@ class InfoViewerPanel(ttk.Frame):
                     return
             else:
                 # Nested list item
-                path = self._get_path_to_item(parent)
-                current = self.current_node.content
-                
-                for path_key in path:
-                    if isinstance(current, dict):
-                        current = current.get(path_key)
-                    elif isinstance(current, list):
-                        try:
-                            idx = int(path_key)
-                            current = current[idx]
-                        except (ValueError, IndexError):
-                            return
-                    else:
-                        return
+                current = self._resolve_container(parent)
                 
                 if isinstance(current, list) and 0 <= index < len(current):
                     item = current[index]
@@ -1389,8 +1567,9 @@ class InfoViewerPanel(ttk.Frame):
                     # Check if value is a dict or list
                     if isinstance(current_value, (dict, list)):
                         # Use dialog for nested structures
-                        dialog = EditValueDialog(self.content_container, json.dumps(current_value, ensure_ascii=False), "Edit Value")
-                        if dialog.result is not None and dialog.result != json.dumps(current_value, ensure_ascii=False):
+                        serialized = json.dumps(current_value, ensure_ascii=False)
+                        dialog = EditValueDialog(self.content_container, serialized, "Edit Value")
+                        if dialog.result is not None and dialog.result != serialized:
                             try:
                                 parsed_value = json.loads(dialog.result)
                                 item[col_name] = parsed_value
@@ -1399,7 +1578,7 @@ class InfoViewerPanel(ttk.Frame):
                                 messagebox.showerror("Error", f"Invalid JSON format:\n{str(e)}")
                     else:
                         # Simple value - inline editing
-                        entry = ttk.Entry(self.content_table, width=max(10, width // 8))
+                        entry = ttk.Entry(self.content_table)
                         entry.insert(0, str(current_value))
                         entry.select_range(0, tk.END)
                         entry.focus()
@@ -1423,12 +1602,7 @@ class InfoViewerPanel(ttk.Frame):
                             except Exception as e:
                                 messagebox.showerror("Error", f"Failed to update value:\n{str(e)}")
                         
-                        def cancel_edit(event=None):
-                            entry.destroy()
-                        
-                        entry.bind('<Return>', finish_edit)
-                        entry.bind('<Escape>', cancel_edit)
-                        entry.bind('<FocusOut>', cancel_edit)
+                        self._bind_inline_edit(entry, finish_edit)
             else:
                 # Simple value item - edit as string
                 if column == '#0':
@@ -1447,8 +1621,9 @@ class InfoViewerPanel(ttk.Frame):
                     
                     # Check if value is a dict or list
                     if isinstance(current_value, (dict, list)):
-                        dialog = EditValueDialog(self.content_container, json.dumps(current_value, ensure_ascii=False), "Edit Value")
-                        if dialog.result is not None and dialog.result != json.dumps(current_value, ensure_ascii=False):
+                        serialized = json.dumps(current_value, ensure_ascii=False)
+                        dialog = EditValueDialog(self.content_container, serialized, "Edit Value")
+                        if dialog.result is not None and dialog.result != serialized:
                             try:
                                 parsed_value = json.loads(dialog.result)
                                 self.current_node.content[index] = parsed_value
@@ -1456,7 +1631,7 @@ class InfoViewerPanel(ttk.Frame):
                             except json.JSONDecodeError as e:
                                 messagebox.showerror("Error", f"Invalid JSON format:\n{str(e)}")
                     else:
-                        entry = ttk.Entry(self.content_table, width=max(10, width // 8))
+                        entry = ttk.Entry(self.content_table)
                         entry.insert(0, str(current_value))
                         entry.select_range(0, tk.END)
                         entry.focus()
@@ -1479,12 +1654,7 @@ class InfoViewerPanel(ttk.Frame):
                             except Exception as e:
                                 messagebox.showerror("Error", f"Failed to update value:\n{str(e)}")
                         
-                        def cancel_edit(event=None):
-                            entry.destroy()
-                        
-                        entry.bind('<Return>', finish_edit)
-                        entry.bind('<Escape>', cancel_edit)
-                        entry.bind('<FocusOut>', cancel_edit)
+                        self._bind_inline_edit(entry, finish_edit)
         except (ValueError, IndexError, KeyError) as e:
             messagebox.showerror("Error", f"Failed to edit item:\n{str(e)}")
     
@@ -1756,6 +1926,12 @@ class InfoViewerPanel(ttk.Frame):
         Args:
             node: The TreeNode to display information about
         """
+        # Saving the previous node refreshes the content too; draw it only once
+        with self._batch_updates():
+            self._display_node_info(node)
+    
+    def _display_node_info(self, node: TreeNode):
+        """Switch to the given node, settling unsaved changes first."""
         # Check if we have unsaved changes when switching nodes
         if self.is_editing and self.current_node and self.current_node != node:
             if self._has_unsaved_changes():
@@ -1826,8 +2002,32 @@ class InfoViewerPanel(ttk.Frame):
             if property_name == "Node Name":
                 self.node_name_item_id = item_id
     
+    @contextmanager
+    def _batch_updates(self):
+        """
+        Defer content refreshes until the outermost batch exits.
+        
+        Any number of _update_content calls inside the block collapse into a
+        single refresh at the end. Blocks may be nested.
+        """
+        self._update_depth += 1
+        try:
+            yield
+        finally:
+            self._update_depth -= 1
+            if self._update_depth == 0 and self._update_dirty:
+                self._update_dirty = False
+                self._update_content()
+    
     def _update_content(self):
         """Update the content tab with node content."""
+        if self._update_depth:
+            self._update_dirty = True
+            return
+        
+        # Table rows are about to be rebuilt, so cached item paths go stale
+        self._path_cache.clear()
+        self._container_cache.clear()
         if not self.current_node:
             return
         
@@ -2061,6 +2261,8 @@ class InfoViewerPanel(ttk.Frame):
         elif self.content_display_mode == "table" and hasattr(self, 'content_table'):
             for item in self.content_table.get_children():
                 self.content_table.delete(item)
+        self._path_cache.clear()
+        self._container_cache.clear()
         
         # Clear children treeview
         for item in self.children_tree.get_children():
@@ -2263,37 +2465,19 @@ class FlexTreeUI:
             old_name: The previous name
             new_name: The new name
         """
-        # Refresh the tree view to show the new name
-        self.treeviewer._populate_treeview()
+        # Show the new name; the structure is unchanged
+        self.treeviewer.refresh_node(node)
         
         # Find and select the renamed node in the tree view
         self._select_node_in_tree(node)
     
     def _select_node_in_tree(self, target_node: TreeNode):
         """Select a specific node in the tree view."""
-        def find_item_by_node(item_id=""):
-            # Get children of the current item (root if item_id is empty)
-            children = self.treeviewer.treeview.get_children(item_id)
-            
-            for child_id in children:
-                # Check if this item corresponds to our target node
-                if child_id in self.treeviewer.node_map:
-                    node = self.treeviewer.node_map[child_id]
-                    if node == target_node:
-                        # Found the node, select it
-                        self.treeviewer.treeview.selection_set(child_id)
-                        self.treeviewer.treeview.focus(child_id)
-                        self.treeviewer.treeview.see(child_id)
-                        return True
-                
-                # Recursively search in children
-                if find_item_by_node(child_id):
-                    return True
-            
-            return False
-        
-        # Start the search from the root
-        find_item_by_node()
+        item_id = self.treeviewer._item_for_node(target_node)
+        if item_id:
+            self.treeviewer.treeview.selection_set(item_id)
+            self.treeviewer.treeview.focus(item_id)
+            self.treeviewer.treeview.see(item_id)
     
     def _new_json_file(self):
         """Create a new JSON file with a default root node."""
@@ -2677,14 +2861,9 @@ Created with FlexTree library."""
     
     def _deep_copy_node(self, node: TreeNode) -> TreeNode:
         """Create a deep copy of a TreeNode and all its children."""
-        # Create new node with copied content
-        new_node = TreeNode(node.name, copy.deepcopy(node.content))
-        
-        # Recursively copy all children
-        for child in node.children:
-            new_node.add_child(self._deep_copy_node(child))
-        
-        return new_node
+        # TreeNode.deepcopy() clones the subtree in one iterative pass and
+        # returns the copy without a parent
+        return node.deepcopy()
     
     def _cut_node(self):
         """Cut the selected node(s) to clipboard."""
@@ -2924,21 +3103,10 @@ Created with FlexTree library."""
     def _ensure_node_parent_expanded(self, parent_name: str):
         """Ensure that the specified parent node is expanded to show its children."""
         try:
-            def find_and_expand_item(item_id, target_name):
-                node = self.treeviewer.node_map.get(item_id)
-                if node and node.name == target_name:
-                    self.treeviewer.treeview.item(item_id, open=True)
-                    return True
-                
-                for child_id in self.treeviewer.treeview.get_children(item_id):
-                    if find_and_expand_item(child_id, target_name):
-                        return True
-                return False
-            
-            # Search through all top-level items
-            for item_id in self.treeviewer.treeview.get_children():
-                if find_and_expand_item(item_id, parent_name):
-                    break
+            item_id = self.treeviewer._item_for_name(parent_name)
+            if item_id:
+                self.treeviewer._populate_item(item_id)
+                self.treeviewer.treeview.item(item_id, open=True)
                     
         except Exception as e:
             # If expansion fails, it's not critical - just log it
@@ -2948,26 +3116,12 @@ Created with FlexTree library."""
         """Select a node in the tree viewer by its name."""
         try:
             # Find the treeview item corresponding to the node name
-            def find_item_by_name(item_id, target_name):
-                node = self.treeviewer.node_map.get(item_id)
-                if node and node.name == target_name:
-                    return item_id
-                
-                for child_id in self.treeviewer.treeview.get_children(item_id):
-                    result = find_item_by_name(child_id, target_name)
-                    if result:
-                        return result
-                return None
-            
-            # Search through all top-level items
-            for item_id in self.treeviewer.treeview.get_children():
-                found_item = find_item_by_name(item_id, name)
-                if found_item:
-                    self.treeviewer.treeview.selection_set(found_item)
-                    self.treeviewer.treeview.focus(found_item)
-                    # Ensure the item is visible
-                    self.treeviewer.treeview.see(found_item)
-                    break
+            found_item = self.treeviewer._item_for_name(name)
+            if found_item:
+                self.treeviewer.treeview.selection_set(found_item)
+                self.treeviewer.treeview.focus(found_item)
+                # Ensure the item is visible
+                self.treeviewer.treeview.see(found_item)
                     
         except Exception as e:
             # If selection fails, it's not critical - just log it
@@ -2989,17 +3143,19 @@ Created with FlexTree library."""
     
     def _name_exists_in_tree(self, name: str) -> bool:
         """Check if a name already exists anywhere in the tree."""
-        return self._name_exists_in_subtree(self.tree.root, name)
+        return name in self.tree
     
     def _name_exists_in_subtree(self, node: TreeNode, name: str) -> bool:
-        """Recursively check if name exists in subtree."""
-        if node.name == name:
-            return True
-        
-        for child in node.children:
-            if self._name_exists_in_subtree(child, name):
+        """Check if name exists in subtree, without recursion."""
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if node.name == name:
                 return True
-        
+            child = node.first_child
+            while child is not None:
+                stack.append(child)
+                child = child.next_sibling
         return False
     
     def _deep_copy_tree(self, tree: Tree) -> Tree:
@@ -3207,8 +3363,8 @@ Created with FlexTree library."""
                     old_name = selected_node.name
                     selected_node.name = new_name
                     
-                    # Refresh the tree display while preserving expansion state
-                    self.treeviewer.load_tree(self.tree, preserve_expansion=True)
+                    # Show the new name; the structure is unchanged
+                    self.treeviewer.refresh_node(selected_node)
                     
                     # Select the renamed node
                     self._select_node_by_name(new_name)
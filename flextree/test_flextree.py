@@ -1,8 +1,9 @@
 import unittest
 import json
+import math
 import tempfile
 import os
-from flextree import TreeNode, Tree, draw_tree
+from flextree import TreeNode, Tree, ArenaTree, draw_tree
 from io import StringIO
 import sys
 
@@ -47,6 +48,18 @@ class TestTreeNode(unittest.TestCase):
         self.root.remove_child("child1")
         self.assertEqual(len(self.root.children), 1)
         self.assertEqual(self.root.children[0].name, "child2")
+
+    def test_remove_child_by_name_duplicates(self):
+        """Test that removing by name removes every match and keeps the order."""
+        names = [f"n{i % 10}" for i in range(30)]
+        for name in names:
+            self.root.add_child(TreeNode(name))
+        self.root.get_child("n9")  # index the wide branch
+        self.root.remove_child("n3")
+        self.assertEqual([c.name for c in self.root.children], [n for n in names if n != "n3"])
+        self.root.remove_child("n0")
+        self.assertEqual([c.name for c in self.root.children],
+                         [n for n in names if n not in ("n0", "n3")])
     
     def test_remove_child_by_index(self):
         """Test removing child by index."""
@@ -123,6 +136,18 @@ class TestTreeNode(unittest.TestCase):
         # Not found
         found = self.root.get_subtree("nonexistent")
         self.assertIsNone(found)
+
+    def test_get_subtree_breadth_first(self):
+        """Test that a breadth-first search returns the shallowest match."""
+        self.root.add_child(self.child1)
+        self.root.add_child(self.child2)
+        self.child1.add_child(self.grandchild)
+        self.grandchild.add_child(TreeNode("child2"))
+        
+        self.assertIs(self.root.get_subtree("child2"), self.grandchild.first_child)
+        self.assertIs(self.root.get_subtree("child2", breadth_first=True), self.child2)
+        self.assertIs(self.root.get_subtree("root", breadth_first=True), self.root)
+        self.assertIsNone(self.root.get_subtree("nonexistent", breadth_first=True))
     
     def test_to_dict(self):
         """Test converting node to dictionary."""
@@ -225,6 +250,13 @@ class TestTreeNode(unittest.TestCase):
         self.assertIn("root content", summary)
         self.assertIn("Max Depth:", summary)
         self.assertIn("Max Width:", summary)
+
+        self.root.add_child(self.child1)
+        self.root.add_child(self.child2)
+        self.child1.add_child(self.grandchild)
+        self.assertEqual(self.root.summary(),
+                         "root: root content\n  - Max Depth: 3\n  - Max Width: 2\n  - Node Count: 4")
+        self.assertEqual(Tree(self.root).summary(), self.root.summary())
     
     def test_summary_long_content(self):
         """Test summary with long content gets truncated."""
@@ -355,7 +387,247 @@ class TestTreeNode(unittest.TestCase):
         self.assertIsNot(copied, original)
         self.assertIsNot(copied.content, original.content)
         self.assertEqual(len(copied.children), 0)
-    
+
+    def test_deepcopy_shared_content(self):
+        """Test that content shared between nodes stays shared in the copy."""
+        import copy
+        shared = {"template": [1, 2]}
+        self.root.add_child(self.child1)
+        self.child1.add_child(self.grandchild)
+        self.child1.content = shared
+        self.grandchild.content = shared
+
+        clone = self.root.deepcopy()
+        clone_child = clone.get_child("child1")
+        self.assertIsNot(clone_child.content, shared)
+        self.assertIs(clone_child.content, clone_child.get_child(0).content)
+        self.assertIsNone(clone.parent)
+
+        # copy.deepcopy() of an inner node copies the whole tree around it
+        inner = copy.deepcopy(self.child1)
+        self.assertEqual(inner.parent.name, "root")
+        self.assertIsNot(inner.parent, self.root)
+        self.assertIs(inner.parent.first_child, inner)
+
+    def test_prev_sibling_links(self):
+        """Test that previous-sibling links follow every way of building a tree."""
+        import pickle
+
+        def check(node):
+            children = node.children
+            if children:
+                self.assertEqual([c.prev_sibling for c in children], [None] + children[:-1])
+            for child in children:
+                check(child)
+
+        for name in ("a", "b", "c", "d"):
+            self.root.add_child(TreeNode(name))
+        self.root.get_child("b").add_child(TreeNode("b1"))
+        check(self.root)
+        for clone in (TreeNode.from_dict(self.root.to_dict()), self.root.deepcopy(),
+                      pickle.loads(pickle.dumps(self.root))):
+            check(clone)
+
+        # Middle, last and first children are detached in place
+        middle, last, first = (self.root.get_child(n) for n in ("b", "d", "a"))
+        self.root.remove_child(middle)
+        self.root.remove_child(last)
+        self.root.remove_child(first)
+        self.assertEqual([c.name for c in self.root.children], ["c"])
+        check(self.root)
+        self.assertIsNone(middle.prev_sibling)
+        with self.assertRaises(ValueError):
+            self.root.remove_child(middle)
+        self.root.add_child(middle)
+        self.assertEqual([c.name for c in self.root.children], ["c", "b"])
+        check(self.root)
+
+    def test_get_child_wide_branch(self):
+        """Test name lookups among many children after changes."""
+        children = [TreeNode(f"c{i}") for i in range(40)]
+        for child in children:
+            self.root.add_child(child)
+        self.root.add_child(TreeNode("c5", "duplicate"))
+        self.assertIs(self.root.get_child("c30"), children[30])
+        self.assertIsNotNone(self.root._child_index)
+        self.assertIs(self.root.get_child("c5"), children[5])
+        self.assertIsNone(self.root.get_child("missing"))
+
+        late = TreeNode("late")
+        self.root.add_child(late)
+        self.assertIs(self.root.get_child("late"), late)
+        children[30].name = "renamed"
+        self.assertIsNone(self.root.get_child("c30"))
+        self.assertIs(self.root.get_child("renamed"), children[30])
+        self.root.remove_child("c5")
+        self.assertIsNone(self.root.get_child("c5"))
+        self.root.remove_child("missing")
+        self.assertEqual(len(self.root.children), 40)
+
+    def test_names_interned(self):
+        """Test that equal string names share one object."""
+        first = TreeNode("".join(["na", "me"]))
+        second = TreeNode("".join(["nam", "e"]))
+        self.assertIs(first.name, second.name)
+        second.name = "".join(["ot", "her"])
+        self.assertIs(second.name, "other")
+        self.assertEqual(TreeNode(1).name, 1)
+
+    def test_deepcopy_links_and_atoms(self):
+        """Test sibling links and content kinds in a deep copy."""
+        self.root.add_child(self.child1)
+        self.root.add_child(self.child2)
+        self.child2.add_child(self.grandchild)
+        self.child1.content = ([1], "text")
+        self.child2.content = 42
+
+        clone = self.root.deepcopy()
+        self.assertEqual([c.name for c in clone.children], ["child1", "child2"])
+        self.assertIs(clone.last_child, clone.first_child.next_sibling)
+        self.assertIsNone(clone.last_child.next_sibling)
+        self.assertIs(clone.last_child.first_child.parent, clone.last_child)
+        self.assertEqual(clone.first_child.content, ([1], "text"))
+        self.assertIsNot(clone.first_child.content[0], self.child1.content[0])
+        self.assertIsNot(clone.first_child.content, self.child1.content)
+        self.assertEqual(clone.last_child.content, 42)
+
+    def test_deepcopy_self_referencing_content(self):
+        """Test that shared and self-referencing contents keep their shape in a deep copy."""
+        shared = {"tags": ["a", "b"]}
+        looped = [1]
+        looped.append(looped)
+        self.root.content = {"shared": shared, "looped": looped}
+        self.root.add_child(TreeNode("child1", shared))
+        self.root.add_child(TreeNode("child2", [shared, (2, 3)]))
+
+        clone = self.root.deepcopy()
+        copied = clone.first_child.content
+        self.assertEqual(copied, shared)
+        self.assertIsNot(copied, shared)
+        self.assertIsNot(copied["tags"], shared["tags"])
+        self.assertIs(clone.content["shared"], copied)
+        self.assertIs(clone.last_child.content[0], copied)
+        self.assertIs(clone.last_child.content[1], self.root.last_child.content[1])
+        self.assertIs(clone.content["looped"][1], clone.content["looped"])
+
+    def test_copy_module_and_pickle(self):
+        """Test copy.deepcopy and pickle on a node wider than the recursion limit."""
+        import copy
+        import pickle
+        width = sys.getrecursionlimit() + 100
+        for i in range(width):
+            self.root.add_child(TreeNode(f"child{i}", {"index": i}))
+        self.root.get_child(0).add_child(self.grandchild)
+
+        for clone in (copy.deepcopy(self.root), pickle.loads(pickle.dumps(self.root))):
+            self.assertEqual(clone.to_dict(), self.root.to_dict())
+            self.assertIsNot(clone.last_child, self.root.last_child)
+            self.assertIsNone(clone.last_child.next_sibling)
+            self.assertIs(clone.get_subtree("grandchild").parent, clone.first_child)
+
+    def test_slots(self):
+        """Test that nodes and trees have no per-instance __dict__."""
+        self.assertFalse(hasattr(self.root, "__dict__"))
+        self.assertFalse(hasattr(Tree(self.root), "__dict__"))
+        with self.assertRaises(AttributeError):
+            self.root.extra = "value"
+
+    def test_pickle_inner_and_detached_nodes(self):
+        """Test pickling nodes inside a tree, detached nodes and node references."""
+        import copy
+        import pickle
+        self.root.add_child(self.child1)
+        self.root.add_child(self.child2)
+        self.child1.add_child(self.grandchild)
+        self.child2.content = {"see": self.grandchild}
+
+        grandchild = pickle.loads(pickle.dumps(self.grandchild))
+        root = grandchild.parent.parent
+        self.assertEqual(root.to_dict()["name"], "root")
+        self.assertEqual([c.name for c in root.children], ["child1", "child2"])
+        self.assertIs(root.last_child.content["see"], grandchild)
+        self.assertIs(root.last_child.prev_sibling, root.first_child)
+
+        # A removed child keeps its parent reference and its own subtree
+        self.root.remove_child(self.child1)
+        child1 = pickle.loads(pickle.dumps(self.child1))
+        self.assertEqual(child1.parent.name, "root")
+        self.assertEqual([c.name for c in child1.parent.children], ["child2"])
+        self.assertEqual(child1.first_child.name, "grandchild")
+
+        shallow = copy.copy(self.root)
+        self.assertIs(shallow.first_child, self.child2)
+        self.assertIs(self.child2.parent, self.root)
+
+    def test_deepcopy_detached_nodes(self):
+        """Test deep copying a removed child and a node below it."""
+        import copy
+        self.root.add_child(self.child1)
+        self.root.add_child(self.child2)
+        self.child1.add_child(self.grandchild)
+        self.root.remove_child(self.child1)
+
+        child1 = copy.deepcopy(self.child1)
+        self.assertIsNot(child1, self.child1)
+        self.assertEqual(child1.first_child.name, "grandchild")
+        self.assertIs(child1.first_child.parent, child1)
+        self.assertEqual(child1.parent.name, "root")
+        self.assertIsNot(child1.parent, self.root)
+        self.assertEqual([c.name for c in child1.parent.children], ["child2"])
+
+        grandchild = copy.deepcopy(self.grandchild)
+        self.assertEqual(grandchild.name, "grandchild")
+        self.assertEqual(grandchild.parent.name, "child1")
+        self.assertEqual([c.name for c in grandchild.parent.children], ["grandchild"])
+
+    def test_deep_tree_beyond_recursion_limit(self):
+        """Test traversals on a chain deeper than the recursion limit."""
+        import pickle
+        depth = sys.getrecursionlimit() + 100
+        root = TreeNode("n0")
+        node = root
+        for i in range(1, depth):
+            child = TreeNode(f"n{i}")
+            node.add_child(child)
+            node = child
+
+        self.assertEqual(root.count(), depth)
+        self.assertEqual(root.max_depth(), depth)
+        self.assertEqual(root.deepcopy().count(), depth)
+        self.assertEqual(TreeNode.from_dict(root.to_dict()).max_depth(), depth)
+        restored = pickle.loads(pickle.dumps(node))
+        self.assertEqual(restored.name, f"n{depth - 1}")
+        while restored.parent is not None:
+            restored = restored.parent
+        self.assertEqual(restored.max_depth(), depth)
+        self.assertEqual(root.max_width(), 1)
+        self.assertIs(root.get_subtree(f"n{depth - 1}"), node)
+        self.assertIn(f"n{depth - 1}", root)
+        self.assertNotIn("missing", root)
+
+        old_stdout = sys.stdout
+        sys.stdout = captured_output = StringIO()
+        try:
+            draw_tree(root)
+        finally:
+            sys.stdout = old_stdout
+        self.assertEqual(len(captured_output.getvalue().splitlines()), depth)
+
+    def test_from_dict_deep(self):
+        """Test from_dict on nesting deeper than the recursion limit."""
+        depth = sys.getrecursionlimit() + 100
+        data = {'name': f"n{depth - 1}", 'content': depth - 1, 'children': []}
+        for i in range(depth - 2, -1, -1):
+            data = {'name': f"n{i}", 'content': i, 'children': [data]}
+        data['children'].append({'name': "last"})
+
+        root = TreeNode.from_dict(data)
+        self.assertEqual(root.count(), depth + 1)
+        self.assertEqual(root.max_depth(), depth)
+        self.assertEqual([child.name for child in root.children], ["n1", "last"])
+        self.assertIs(root.last_child.parent, root)
+        self.assertIsNone(root.last_child.content)
+
     def test_contains(self):
         """Test __contains__ method for TreeNode."""
         root = TreeNode("root")
@@ -401,6 +673,34 @@ class TestTreeNode(unittest.TestCase):
         self.assertFalse(child.is_leaf())
         self.assertTrue(grandchild.is_leaf())
 
+    def test_sibling_links(self):
+        """Test first/last child and next sibling links."""
+        self.root.add_child(self.child1)
+        self.root.add_child(self.child2)
+        self.assertIs(self.root.first_child, self.child1)
+        self.assertIs(self.root.last_child, self.child2)
+        self.assertIs(self.child1.next_sibling, self.child2)
+        self.assertIsNone(self.child2.next_sibling)
+
+        # The children list is a snapshot of the links
+        self.root.children.append(self.grandchild)
+        self.assertEqual(len(self.root.children), 2)
+
+        self.root.remove_child(self.child2)
+        self.assertIs(self.root.last_child, self.child1)
+        self.assertIsNone(self.child1.next_sibling)
+        with self.assertRaises(ValueError):
+            self.root.remove_child(self.child2)
+
+    def test_add_child_moves_node(self):
+        """Test that adding an attached node detaches it from its old parent."""
+        self.root.add_child(self.child1)
+        self.root.add_child(self.child2)
+        self.child2.add_child(self.child1)
+        self.assertEqual([c.name for c in self.root.children], ["child2"])
+        self.assertIs(self.child1.parent, self.child2)
+        self.assertEqual(self.root.count(), 3)
+
 
 class TestTree(unittest.TestCase):
     
@@ -478,7 +778,162 @@ class TestTree(unittest.TestCase):
         """Test getting nonexistent node."""
         result = self.tree.get("nonexistent")
         self.assertIsNone(result)
-    
+
+    def test_name_index_follows_node_changes(self):
+        """Test that name lookups see changes made directly on nodes."""
+        child = TreeNode("child", "child content")
+        self.tree.insert("root", child)
+        self.assertIn("child", self.tree)
+
+        # Rename and relink through TreeNode, bypassing the Tree
+        child.name = "renamed"
+        self.assertNotIn("child", self.tree)
+        self.assertEqual(self.tree.get("renamed").root, child)
+
+        grandchild = TreeNode("grandchild")
+        child.add_child(grandchild)
+        self.assertTrue(self.tree.is_leaf("grandchild"))
+
+        self.root.remove_child(child)
+        self.assertIsNone(self.tree.get("grandchild"))
+
+    def test_name_index_duplicates(self):
+        """Test that lookups return the first match in pre-order."""
+        first = TreeNode("first")
+        second = TreeNode("second")
+        self.tree.insert("root", first)
+        self.tree.insert("root", second)
+        late_dup = TreeNode("dup", "under second")
+        self.tree.insert("second", late_dup)
+        early_dup = TreeNode("dup", "under first")
+        self.tree.insert("first", early_dup)
+        # The collision is resolved in place instead of forcing a rebuild
+        self.assertEqual(self.tree._index_version, TreeNode._structure_version)
+        self.assertIs(self.tree.get("dup").root, early_dup)
+        self.assertEqual(self.tree._index_overflow, {"dup": [early_dup, late_dup]})
+
+        self.tree.delete("dup")
+        self.assertIs(self.tree.get("dup").root, late_dup)
+        self.assertEqual(self.tree._index_overflow, {})
+        self.tree.delete("dup")
+        self.assertNotIn("dup", self.tree)
+
+        # Moving a node within the tree re-positions it in the index
+        self.tree.insert("second", TreeNode("dup", "under second"))
+        self.tree.insert("first", TreeNode("dup", "under first"))
+        moved = self.tree.get("dup").root
+        self.tree.insert("second", moved)
+        self.assertEqual(self.tree._index_version, TreeNode._structure_version)
+        self.assertEqual(self.tree.get("dup").root.content, "under second")
+        self.assertIsNot(self.tree.get("dup").root, moved)
+
+    def test_insert_delete_update_index(self):
+        """Test that insert and delete keep the name index current."""
+        branch = TreeNode("branch")
+        branch.add_child(TreeNode("leaf"))
+        self.tree.insert("root", branch)
+        self.assertEqual(self.tree._index_version, TreeNode._structure_version)
+        self.assertIs(self.tree.get("leaf").root, branch.first_child)
+
+        self.tree.delete("branch")
+        self.assertEqual(self.tree._index_version, TreeNode._structure_version)
+        self.assertNotIn("leaf", self.tree._index)
+        self.assertEqual(list(self.tree._index), ["root"])
+
+    def test_name_index_with_unhashable_name(self):
+        """Test that an unhashable node name does not hide the other nodes."""
+        self.tree.insert("root", TreeNode("a", "content a"))
+        odd = TreeNode(["x"])
+        self.root.add_child(odd)
+        self.assertIn("a", self.tree)
+        self.assertEqual(self.tree["a"].root.content, "content a")
+        self.assertEqual(self.tree.get("a").root.name, "a")
+        self.assertIn(["x"], self.tree)
+        self.assertIs(self.tree._lookup(["x"]), odd)
+
+        # Inserting and deleting around the unhashable name keeps the index
+        self.tree.insert("a", TreeNode(["y"]))
+        self.tree.insert("a", TreeNode("b"))
+        self.assertIn("b", self.tree)
+        self.tree.delete(["x"])
+        self.assertNotIn(["x"], self.tree)
+        self.assertIn(["y"], self.tree)
+        self.assertEqual(self.tree._index_version, TreeNode._structure_version)
+        self.assertEqual(list(self.tree._index), ["root", "a", "b"])
+
+    def test_stats_follow_changes(self):
+        """Test that cached statistics are refreshed after changes."""
+        self.assertEqual((self.tree.count(), self.tree.max_depth(), self.tree.max_width()), (1, 1, 1))
+        child = TreeNode("child")
+        self.tree.insert("root", child)
+        self.tree.insert("root", TreeNode("other"))
+        self.assertEqual((self.tree.count(), self.tree.max_depth(), self.tree.max_width()), (3, 2, 2))
+
+        # Changes made directly on nodes are seen as well
+        child.add_child(TreeNode("leaf"))
+        self.assertEqual(self.tree.max_depth(), 3)
+        self.tree.root = child
+        self.assertEqual(self.tree.count(), 2)
+
+        # Renaming keeps the cached statistics
+        stats = child._stats_cache
+        child.name = "renamed"
+        self.assertEqual(self.tree.max_depth(), 2)
+        self.assertIs(child._stats_cache, stats)
+
+        # Changes below a node with cached statistics are seen
+        leaf = child.first_child
+        self.assertEqual(leaf.count(), 1)
+        leaf.add_child(TreeNode("deeper"))
+        self.assertEqual((child.count(), child.max_depth(), leaf.max_depth()), (3, 3, 2))
+        child.remove_child(leaf)
+        self.assertEqual((self.tree.count(), self.tree.max_width()), (1, 1))
+
+    def test_stats_uneven_tree(self):
+        """Test statistics when the widest node is not on the deepest path."""
+        wide = TreeNode("wide")
+        for i in range(4):
+            wide.add_child(TreeNode(f"w{i}"))
+        deep = TreeNode("deep")
+        node = deep
+        for i in range(5):
+            node.add_child(TreeNode(f"d{i}"))
+            node = node.first_child
+        self.root.add_child(deep)
+        self.root.add_child(wide)
+        self.assertEqual((self.tree.count(), self.tree.max_depth(), self.tree.max_width()), (12, 7, 4))
+        self.assertEqual(deep.max_depth(), 6)
+
+    def test_compile(self):
+        """Test flattening a tree into a compact ArenaTree."""
+        child = TreeNode("child", "child content")
+        self.tree.insert("root", child)
+        self.tree.insert("root", TreeNode("other"))
+        self.tree.insert("child", TreeNode("leaf"))
+
+        compiled = self.tree.compile()
+        self.assertIsInstance(compiled, ArenaTree)
+        self.assertEqual(compiled.count(), self.tree.count())
+        self.assertEqual(compiled.max_depth(), self.tree.max_depth())
+        self.assertEqual(compiled.max_width(), self.tree.max_width())
+        self.assertEqual(compiled.to_node().to_dict(), self.tree.to_dict())
+
+        # A snapshot: later changes are not reflected
+        self.tree.delete("leaf")
+        self.assertEqual(compiled.count(), 4)
+
+    def test_intern_contents(self):
+        """Test that equal string contents end up shared."""
+        role = "".join(["edi", "tor"])
+        node = TreeNode("a", "".join(["ed", "itor"]), intern_content=True)
+        self.assertIsNot(node.content, role)
+        self.tree.insert("root", node)
+        self.tree.insert("root", TreeNode("b", role))
+        self.tree.insert("root", TreeNode("c", {"role": role}))
+        self.tree.intern_contents()
+        self.assertIs(self.tree.get("a").root.content, self.tree.get("b").root.content)
+        self.assertEqual(self.tree.get("c").root.content, {"role": "editor"})
+
     def test_summary(self):
         """Test tree summary."""
         summary = self.tree.summary()
@@ -616,7 +1071,46 @@ class TestTree(unittest.TestCase):
         self.assertEqual(len(last_two), 2)
         self.assertEqual(last_two[0].root, child2)
         self.assertEqual(last_two[1].root, child3)
-    
+
+        # Test stepped slice
+        self.assertEqual([t.root for t in self.tree[::-2]], [child3, child1])
+
+    def test_getitem_reuses_subtrees(self):
+        """Test that repeated lookups return the same subtree objects."""
+        child1 = TreeNode("child1", "content1")
+        child2 = TreeNode("child2", "content2")
+        self.tree.insert("root", child1)
+        self.tree.insert("root", child2)
+
+        first = self.tree["child1"]
+        self.assertIs(self.tree[0], first)
+        self.assertIs(self.tree.get("child1"), first)
+        self.assertEqual(self.tree[:], [first, self.tree["child2"]])
+
+        # A changed structure or a reassigned root gives a fresh wrapper
+        first.root = child2
+        self.assertIs(self.tree["child1"].root, child1)
+        wrapper = self.tree["child1"]
+        child1.add_child(TreeNode("leaf"))
+        self.assertIsNot(self.tree["child1"], wrapper)
+        self.assertIs(self.tree["child1"].root, child1)
+
+    def test_getitem_key_subclasses(self):
+        """Test getitem with keys that subclass the supported types."""
+        child1 = TreeNode("child1", "content1")
+        child2 = TreeNode("child2", "content2")
+        self.tree.insert("root", child1)
+        self.tree.insert("root", child2)
+
+        class Name(str):
+            pass
+
+        self.assertEqual(self.tree[True].root, child2)
+        self.assertEqual(self.tree[Name("child1")].root, child1)
+        self.assertIsNone(self.tree[1.5])
+        with self.assertRaises(IndexError):
+            self.tree[-3]
+
     def test_getitem_by_list(self):
         """Test Tree getitem access by list of keys."""
         child1 = TreeNode("child1", "content1")
@@ -634,6 +1128,11 @@ class TestTree(unittest.TestCase):
         self.assertIsInstance(selected[1], Tree)
         self.assertEqual(selected[0].root, child1)
         self.assertEqual(selected[1].root, child3)
+
+        # Missing names are skipped and renamed nodes are found
+        child2.name = "renamed"
+        selected = self.tree[["child2", "renamed", "missing", "child1"]]
+        self.assertEqual([t.root for t in selected], [child2, child1])
     
     def test_getitem_chaining(self):
         """Test chaining getitem operations."""
@@ -681,11 +1180,134 @@ class TestTree(unittest.TestCase):
             self.assertEqual(len(loaded_tree.root.children), 1)
             self.assertEqual(loaded_tree.root.children[0].name, "child")
             self.assertEqual(loaded_tree.root.children[0].content, {"key": "value"})
-            
+
         finally:
             if os.path.exists(temp_file):
                 os.unlink(temp_file)
-    
+
+    def test_load_json_empty_file(self):
+        """Test that loading an empty file reports a JSON error."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            temp_file = f.name
+
+        try:
+            with self.assertRaises(ValueError):
+                Tree.load_json(temp_file)
+        finally:
+            os.unlink(temp_file)
+
+    def test_save_json_format(self):
+        """Test the saved file layout and content the fast encoder cannot handle."""
+        content = {"text": "café", "big": 2 ** 70, 1: "int key", "items": (1, 2)}
+        self.root.add_child(TreeNode("child", content))
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            temp_file = f.name
+
+        try:
+            self.tree.save_json(temp_file)
+            with open(temp_file, 'r', encoding='utf-8') as f:
+                text = f.read()
+            self.assertIn("café", text)
+            self.assertIn('\n  "name": "root"', text)
+
+            loaded_tree = Tree.load_json(temp_file)
+            self.assertEqual(loaded_tree.root.children[0].content,
+                             {"text": "café", "big": 2 ** 70, "1": "int key", "items": [1, 2]})
+            self.assertIsInstance(loaded_tree.root.children[0].content["big"], int)
+
+            # The streamed layout matches json.dump(indent=2) of to_dict()
+            self.root.remove_child("child")
+            self.tree.insert("root", TreeNode("a", {"nested": [1, {"x": None}]}))
+            self.tree.insert("a", TreeNode("b", []))
+            self.tree.insert("b", TreeNode("e", [float("nan"), {"inf": float("inf")}, -float("inf")]))
+            self.tree.insert("root", TreeNode("c", "line\nbreak"))
+            self.tree.insert("root", TreeNode("d", {"big": 1e16, "small": 1.5e-05, 2.5: [0.1]}))
+            self.tree.save_json(temp_file)
+            with open(temp_file, 'r', encoding='utf-8') as f:
+                text = f.read()
+            self.assertEqual(text, json.dumps(self.tree.to_dict(), ensure_ascii=False, indent=2))
+        finally:
+            if os.path.exists(temp_file):
+                os.unlink(temp_file)
+
+    def test_save_json_rejects_non_json_content(self):
+        """Test that content json cannot encode raises TypeError with or without orjson."""
+        import datetime
+        from unittest import mock
+        import flextree.flextree as flextree_module
+        self.root.add_child(TreeNode("child", {"when": datetime.datetime(2020, 1, 1)}))
+        self.root.add_child(TreeNode("day", {"d": datetime.date(2020, 1, 1)}))
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            temp_file = f.name
+
+        try:
+            with self.assertRaises(TypeError):
+                self.tree.save_json(temp_file)
+            with mock.patch.object(flextree_module, "orjson", None):
+                with self.assertRaises(TypeError):
+                    self.tree.save_json(temp_file)
+        finally:
+            os.unlink(temp_file)
+
+    def test_save_and_load_json_integers_beyond_64_bits(self):
+        """Test that integers outside the 64-bit range stay exact in a save and load."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            temp_file = f.name
+
+        try:
+            # One value per file, so no other value sends the file to json
+            for value in (-2 ** 63 - 1, 2 ** 64, -2 ** 63, 2 ** 64 - 1):
+                with self.subTest(value=value):
+                    Tree(TreeNode("root", {"v": value})).save_json(temp_file)
+                    content = Tree.load_json(temp_file).root.content
+                    self.assertEqual(content, {"v": value})
+                    self.assertIsInstance(content["v"], int)
+                    arena = ArenaTree.load_json(temp_file)
+                    self.assertEqual(arena.content(0), {"v": value})
+        finally:
+            os.unlink(temp_file)
+
+    def test_save_and_load_json_non_finite_floats(self):
+        """Test that NaN and infinite contents survive a save and load."""
+        self.root.add_child(TreeNode("child", {"x": float("nan"), "y": float("inf"),
+                                               "z": [float("-inf"), 0.5]}))
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            temp_file = f.name
+
+        try:
+            self.tree.save_json(temp_file)
+            content = Tree.load_json(temp_file).root.children[0].content
+        finally:
+            os.unlink(temp_file)
+
+        self.assertTrue(math.isnan(content["x"]))
+        self.assertEqual(content["y"], float("inf"))
+        self.assertEqual(content["z"], [float("-inf"), 0.5])
+
+    def test_load_json_written_by_json_dump(self):
+        """Test loading a file written by json.dump, including NaN and Infinity literals."""
+        self.root.add_child(TreeNode("child", {"x": float("nan"), "y": float("-inf"), "n": 1}))
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False,
+                                         encoding='utf-8') as f:
+            json.dump(self.tree.to_dict(), f, ensure_ascii=False, indent=2)
+            temp_file = f.name
+
+        try:
+            loaded = Tree.load_json(temp_file)
+            arena = ArenaTree.load_json(temp_file)
+        finally:
+            os.unlink(temp_file)
+
+        content = loaded.root.children[0].content
+        self.assertTrue(math.isnan(content["x"]))
+        self.assertEqual(content["y"], float("-inf"))
+        self.assertEqual(content["n"], 1)
+        self.assertEqual(arena.content(arena.find("child"))["y"], float("-inf"))
+
     def test_draw(self):
         """Test that draw method produces output without errors."""
         child = TreeNode("child", "child content")
@@ -876,6 +1498,28 @@ class TestTree(unittest.TestCase):
         self.assertTrue("child" in tree)
         self.assertTrue("grandchild" in tree)
         self.assertFalse("nonexistent" in tree)
+        self.assertFalse(["root"] in tree)
+    
+    def test_iter_and_walk(self):
+        """Test iterating over a tree depth-first and breadth-first."""
+        child = TreeNode("child")
+        self.tree.insert("root", child)
+        self.tree.insert("child", TreeNode("grandchild"))
+        self.tree.insert("root", TreeNode("sibling"))
+        
+        self.assertEqual([n.name for n in self.tree], ["root", "child", "grandchild", "sibling"])
+        self.assertEqual([n.name for n in self.tree.walk(breadth_first=True)],
+                         ["root", "child", "sibling", "grandchild"])
+        
+        # The node list follows changes made after an earlier walk
+        names = []
+        for node in self.tree:
+            names.append(node.name)
+            if node is child:
+                child.add_child(TreeNode("late"))
+        self.assertEqual(names, ["root", "child", "grandchild", "sibling"])
+        self.assertEqual([n.name for n in self.tree],
+                         ["root", "child", "grandchild", "late", "sibling"])
     
     def test_tree_is_leaf(self):
         """Test is_leaf method for Tree."""
@@ -952,7 +1596,57 @@ class TestDrawTree(unittest.TestCase):
             
         finally:
             sys.stdout = old_stdout
-    
+
+    def test_draw_tree_repeated(self):
+        """Test that repeated drawings follow changes to the tree."""
+        root = TreeNode("root")
+        child = TreeNode("child")
+        root.add_child(child)
+
+        def render(**kwargs):
+            old_stdout = sys.stdout
+            sys.stdout = captured_output = StringIO()
+            try:
+                draw_tree(root, **kwargs)
+            finally:
+                sys.stdout = old_stdout
+            return captured_output.getvalue()
+
+        first = render()
+        self.assertEqual(render(), first)
+        child.name = "renamed"
+        self.assertIn("renamed", render())
+        child.add_child(TreeNode("leaf"))
+        self.assertIn("leaf", render())
+        self.assertTrue(render(prefix="  ").startswith("  "))
+        self.assertEqual(render(), "└── root\n    └── renamed\n        └── leaf\n")
+
+        # Without a key no content is shown, so content edits cannot
+        # leave a reused drawing stale
+        root.content = {None: "v1", "desc": "d1"}
+        self.assertEqual(render(), "└── root\n    └── renamed\n        └── leaf\n")
+        root.content[None] = "v2"
+        self.assertEqual(render(), "└── root\n    └── renamed\n        └── leaf\n")
+        root.content["desc"] = "d2"
+        self.assertTrue(render(key="desc").startswith("└── root: d2\n"))
+
+    def test_draw_tree_file(self):
+        """Test that draw_tree writes to the given stream instead of stdout."""
+        root = TreeNode("root", {"desc": "root description"})
+        root.add_child(TreeNode("child"))
+        old_stdout = sys.stdout
+        sys.stdout = captured_stdout = StringIO()
+        try:
+            target = StringIO()
+            draw_tree(root, file=target)
+            draw_tree(root, key="desc", file=target)
+        finally:
+            sys.stdout = old_stdout
+        self.assertEqual(captured_stdout.getvalue(), "")
+        self.assertEqual(target.getvalue(),
+                         "└── root\n    └── child\n"
+                         "└── root: root description\n    └── child\n")
+
     def test_draw_tree_custom_key(self):
         """Test draw_tree with custom key."""
         root = TreeNode("root", {"desc": "root description", "other": "ignored"})
@@ -1069,5 +1763,169 @@ class TestDrawTree(unittest.TestCase):
             sys.stdout = old_stdout
 
 
+class TestArenaTree(unittest.TestCase):
+
+    def setUp(self):
+        """Set up an arena tree mirroring a small TreeNode tree."""
+        self.root = TreeNode("root", "root content")
+        child1 = TreeNode("child1", "content1")
+        child2 = TreeNode("child2", "content2")
+        self.root.add_child(child1)
+        self.root.add_child(child2)
+        child1.add_child(TreeNode("grandchild", "gc content"))
+        self.arena = ArenaTree.from_node(self.root)
+
+    def test_add_child(self):
+        """Test building an arena tree directly."""
+        arena = ArenaTree("root")
+        child = arena.add_child(0, "child", "content")
+        self.assertEqual(child, 1)
+        self.assertEqual(arena.name(child), "child")
+        self.assertEqual(arena.content(child), "content")
+        self.assertEqual(arena.children(0), [child])
+        with self.assertRaises(IndexError):
+            arena.add_child(5, "orphan")
+
+    def test_slots_and_copy(self):
+        """Test that arenas have no __dict__ and still copy and pickle."""
+        import copy
+        import pickle
+        self.assertFalse(hasattr(self.arena, "__dict__"))
+        self.assertFalse(hasattr(self.arena._arena, "__dict__"))
+        for clone in (copy.deepcopy(self.arena), pickle.loads(pickle.dumps(self.arena))):
+            self.assertEqual(clone.to_node().to_dict(), self.root.to_dict())
+
+    def test_stats_match_tree(self):
+        """Test that arena statistics match the TreeNode implementation."""
+        self.assertEqual(self.arena.count(), self.root.count())
+        self.assertEqual(self.arena.max_depth(), self.root.max_depth())
+        self.assertEqual(self.arena.max_width(), self.root.max_width())
+        self.assertEqual(len(self.arena), 4)
+
+        single = ArenaTree("only")
+        self.assertEqual(single.count(), 1)
+        self.assertEqual(single.max_depth(), 1)
+        self.assertEqual(single.max_width(), 1)
+
+    def test_children_order(self):
+        """Test that children keep their insertion order."""
+        names = [self.arena.name(i) for i in self.arena.children(0)]
+        self.assertEqual(names, ["child1", "child2"])
+
+    def test_find(self):
+        """Test finding nodes by name."""
+        idx = self.arena.find("grandchild")
+        self.assertIsNotNone(idx)
+        self.assertEqual(self.arena.content(idx), "gc content")
+        self.assertIsNone(self.arena.find("nonexistent"))
+
+        # With duplicates the first match in pre-order wins, not the lowest index
+        child2 = self.arena.find("child2")
+        self.arena.add_child(self.arena.find("grandchild"), "dup", "deep")
+        self.arena.add_child(child2, "dup", "shallow")
+        self.arena.compact()
+        self.assertEqual(self.arena.content(self.arena.find("dup")), "deep")
+
+    def test_to_node_round_trip(self):
+        """Test converting an arena tree back to TreeNode objects."""
+        node = self.arena.to_node()
+        self.assertEqual(node.to_dict(), self.root.to_dict())
+        subtree = self.arena.to_node(self.arena.find("child1"))
+        self.assertEqual(subtree.name, "child1")
+        self.assertEqual(subtree.count(), 2)
+
+    def test_compact(self):
+        """Test that compaction stores siblings at consecutive indices."""
+        arena = ArenaTree("root")
+        a = arena.add_child(0, "a")
+        arena.add_child(a, "a1")
+        b = arena.add_child(0, "b")
+        arena.add_child(a, "a2")
+        arena.add_child(b, "b1")
+        self.assertEqual(arena.children(a), [2, 4])
+        before = arena.to_node().to_dict()
+
+        arena.compact()
+        self.assertEqual([arena.name(i) for i in range(len(arena))],
+                         ["root", "a", "b", "a1", "a2", "b1"])
+        self.assertEqual(arena.children(0), [1, 2])
+        self.assertEqual(arena.children(arena.find("a")), [3, 4])
+        self.assertEqual(arena.to_node().to_dict(), before)
+        arena.compact()
+        self.assertEqual(arena.children(2), [5])
+
+        # from_node already yields the breadth-first layout
+        names = [self.arena.name(i) for i in range(len(self.arena))]
+        self.assertEqual(names, ["root", "child1", "child2", "grandchild"])
+
+    def test_compact_layout(self):
+        """Test stats on a compact arena and adding nodes after compaction."""
+        arena = ArenaTree.from_node(self.root)
+        self.assertIsNone(arena._arena.first_child)
+        self.assertEqual(arena.count(), self.root.count())
+        self.assertEqual(arena.max_depth(), self.root.max_depth())
+        self.assertEqual(arena.max_width(), self.root.max_width())
+        self.assertEqual(arena.find("grandchild"), 3)
+
+        extra = arena.add_child(1, "extra")
+        self.assertIsNone(arena._arena.child_start)
+        self.assertEqual(arena.children(1), [3, extra])
+        self.assertEqual(arena.children(0), [1, 2])
+        self.assertEqual(arena.max_width(), 2)
+        arena.add_child(extra, "deep")
+        self.assertEqual(arena.max_depth(), 4)
+
+    def test_from_dict_and_load_json(self):
+        """Test building a compact arena from a dictionary or JSON file."""
+        arena = ArenaTree.from_dict(self.root.to_dict())
+        self.assertEqual(arena.to_node().to_dict(), self.root.to_dict())
+        self.assertEqual(arena.children(1), [3])
+
+        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
+            filepath = f.name
+        try:
+            Tree(self.root).save_json(filepath)
+            loaded = ArenaTree.load_json(filepath)
+        finally:
+            os.unlink(filepath)
+        self.assertEqual(len(loaded), 4)
+        self.assertEqual(loaded.content(loaded.find("grandchild")), "gc content")
+
+    def test_max_width_without_numpy(self):
+        """Test that max_width gives the same result without NumPy."""
+        import flextree.flextree as module
+        arena = ArenaTree.from_node(self.root)
+        linked = ArenaTree.from_node(self.root)
+        linked.add_child(2, "extra")
+        expected = [arena.max_width(), linked.max_width(), ArenaTree("x").max_width()]
+        saved, module.np = module.np, None
+        try:
+            actual = [arena.max_width(), linked.max_width(), ArenaTree("x").max_width()]
+        finally:
+            module.np = saved
+        self.assertEqual(actual, expected)
+        self.assertEqual(expected, [2, 2, 1])
+
+    def test_max_depth_kernel(self):
+        """Test the Numba max_depth kernel, run as plain Python and compiled."""
+        import flextree.flextree as module
+        if module.np is None:
+            self.skipTest("NumPy is not installed")
+        linked = ArenaTree.from_node(self.root)
+        linked.add_child(3, "deeper")
+        parent = module.np.frombuffer(linked._arena.parent, dtype=module.np.intc)
+        self.assertEqual(module._max_depth_kernel(parent), linked.max_depth())
+        self.assertEqual(linked.max_depth(), 4)
+        kernel = module._jit_kernel("max_depth")
+        if kernel is not None:
+            self.assertEqual(kernel(parent), 4)
+        self.assertEqual(module._max_depth_numpy(parent), 4)
+        self.assertEqual(module._max_depth_numpy(parent[:1]), 1)
+
+    def test_repr(self):
+        """Test ArenaTree string representation."""
+        self.assertEqual(repr(self.arena), "ArenaTree(root=root, nodes=4)")
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -29,6 +29,10 @@ setup(
         "Topic :: Data Structures",
     ],
     python_requires=">=3.6",
+    extras_require={
+        "fast": ["orjson>=3.0", "numpy"],
+        "jit": ["numpy", "numba"],
+    },
     keywords="tree, data-structure, node, hierarchy, graph",
     project_urls={
         "Bug Reports": "https://github.com/znzhao/flextree/issues",